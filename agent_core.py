@@ -7,18 +7,36 @@ Single-file implementation of Interviewer, Evaluator and Coach for the SkillBrid
 Goals and compatibility:
 - Deterministic heuristics when no LLM provider keys are configured.
 - Evaluator exposes helper methods: _score_clarity, _score_structure, _score_relevance
+  (thin wrappers over a single tokenizing pass, see `_analyze`)
 - Returns both 'structure' and 'star_structure' where appropriate to remain
   compatible with different callers.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import logging
 import os
 import random
 import re
+import sqlite3
+import threading
 import time
-from typing import Any, Dict, Optional, Tuple
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
+
+try:  # optional: vectorized cosine similarity for the semantic cache
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is not a hard dependency
+    np = None
+
+logger = logging.getLogger(__name__)
 
 # Paths
 ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -26,52 +44,200 @@ DATA_DIR = os.path.join(ROOT, "data")
 QUESTIONS_FILE = os.path.join(DATA_DIR, "questions.json")
 RUBRIC_FILE = os.path.join(DATA_DIR, "rubric.json")
 COACH_TEMPLATES_FILE = os.path.join(DATA_DIR, "coach_templates.json")
+# Coach feedback cache lives outside the checkout so it survives redeploys
+COACH_CACHE_DB = os.path.join(os.path.expanduser("~"), ".skillbridge", "coach_cache.sqlite")
 
 
-def _load_json_safe(path: str) -> Any:
+class _FrozenDict(dict):
+    """Read-only dict shared between callers of the JSON cache (still JSON-serializable)."""
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("cached JSON data is read-only")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> Any:
+        return (self.__class__, (dict(self),))
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return _FrozenDict((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _file_version(path: str) -> Tuple[str, int]:
     if not os.path.exists(path):
         raise FileNotFoundError(f"Required file not found: {path}")
+    return path, os.stat(path).st_mtime_ns
+
+
+@lru_cache(maxsize=32)
+def _load_json_cached(path: str, mtime_ns: int) -> Any:
     with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+        return _freeze(json.load(f))
+
+
+def _load_json_safe(path: str) -> Any:
+    """Parsed, read-only JSON for `path`; re-read only when the file's mtime changes."""
+    return _load_json_cached(*_file_version(path))
+
+
+@lru_cache(maxsize=32)
+def _index_by_difficulty(path: str, mtime_ns: int) -> Dict[str, Tuple[Tuple[Any, ...], Tuple[Dict[str, Any], ...]]]:
+    """Bucket questions by difficulty as parallel (ids, questions) tuples; "all" holds every question."""
+    questions = _load_json_cached(path, mtime_ns)
+    by_difficulty: Dict[str, List[Dict[str, Any]]] = {"easy": [], "medium": [], "hard": []}
+    for q in questions:
+        d = q.get("difficulty", "medium")
+        if d not in by_difficulty:
+            d = "medium"
+        by_difficulty[d].append(q)
+    by_difficulty["all"] = list(questions)
+    return _FrozenDict(
+        (d, (tuple(q.get("id") for q in qs), tuple(qs))) for d, qs in by_difficulty.items()
+    )
+
+
+_WORD_RE = re.compile(r"\w+")
+_RESULT_RE = re.compile(r"\d+%|\d+\s+(seconds|ms|minutes|hours|days|people|users)|\b(reduc|increas|improv|save|boost)\b", re.I)
+_FILLER_RE = re.compile(r"\b(um|uh|like|you know|basically|actually)\b", re.I)
+_ACTION_RE = re.compile(r"\b(implemented|designed|built|created|led|refactored|optimized|deployed|tested|wrote|improved)\b", re.I)
+# Shortest strings _ACTION_RE / _RESULT_RE can match ("led", "5%"); anything
+# shorter is answered without running the regex.
+_MIN_ACTION_LEN = 3
+_MIN_RESULT_LEN = 2
+_STOP = frozenset({"the", "a", "an", "and", "or", "to", "of", "in", "on", "for", "with", "is", "it", "that"})
+
+# STAR hints matched as plain substrings of the lowercased text (so "led" also
+# hits "filled"); checked before the word-bounded _ACTION_RE / _RESULT_RE scans.
+_ACTION_HINTS = ("implemented", "led", "action", "did", "responsible")
+_RESULT_HINTS = ("result", "outcome", "reduced", "improved", "increased")
+
+
+# Below this many pairs, Evaluator.score_many skips the process pool; spawning
+# workers costs more than scoring a few hundred answers inline.
+_SCORE_MANY_INLINE = 256
+
+
+# ASCII non-word characters -> space, so translate() + split() yields exactly
+# the `\w+` runs; much faster than re.findall on long transcripts.
+_NONWORD_TRANS = str.maketrans({c: " " for c in map(chr, range(128)) if not (c.isalnum() or c == "_")})
+
+
+def _words(text: str) -> List[str]:
+    """`_WORD_RE.findall(text)`, via str.translate/split for ASCII text."""
+    if text.isascii():
+        return text.translate(_NONWORD_TRANS).split()
+    return _WORD_RE.findall(text)
 
 
 def _word_count(text: Optional[str]) -> int:
     if not text:
         return 0
-    return len(re.findall(r"\w+", text))
+    return len(_words(text))
 
 
 def _has_result_like_phrase(text: str) -> bool:
-    if not text:
+    if not text or len(text) < _MIN_RESULT_LEN:
         return False
-    return bool(re.search(r"\d+%|\d+\s+(seconds|ms|minutes|hours|days|people|users)|\b(reduc|increas|improv|save|boost)\b", text, re.I))
+    return bool(_RESULT_RE.search(text))
 
 
 def _contains_action_words(text: str) -> bool:
-    if not text:
+    if not text or len(text) < _MIN_ACTION_LEN:
         return False
-    verbs = [
-        "implemented",
-        "designed",
-        "built",
-        "created",
-        "led",
-        "refactored",
-        "optimized",
-        "deployed",
-        "tested",
-        "wrote",
-        "improved",
-    ]
-    return any(re.search(rf"\b{v}\b", text, re.I) for v in verbs)
+    return bool(_ACTION_RE.search(text))
+
+
+@dataclass(frozen=True)
+class TextFeatures:
+    """Everything the heuristic scorers need from one piece of text."""
+
+    empty: bool
+    wc: int
+    fillers: int
+    has_action: bool
+    has_result: bool
+    tokens: FrozenSet[str]  # lowercased, stopwords removed
+
+
+def _analyze(text: Optional[str]) -> TextFeatures:
+    """Tokenize `text` once and collect word count, fillers, STAR signals and token set."""
+    if not text:
+        return TextFeatures(True, 0, 0, False, False, frozenset())
+    # count words on the original text: lower() can change the length of some characters
+    wc = len(_words(text))
+    lower = text.lower()
+    words = _words(lower)
+    has_action = any(w in lower for w in _ACTION_HINTS) or _contains_action_words(text)
+    has_result = any(w in lower for w in _RESULT_HINTS) or _has_result_like_phrase(text)
+    return TextFeatures(
+        empty=False,
+        wc=wc,
+        fillers=len(_FILLER_RE.findall(lower)),
+        has_action=has_action,
+        has_result=has_result,
+        tokens=frozenset(words).difference(_STOP),
+    )
+
+
+_LLM_INIT_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_LLM_INIT_LOCK = threading.Lock()
+
+
+def _llm_init_executor() -> ThreadPoolExecutor:
+    """Single background worker that constructs Gemini clients off the caller's thread."""
+    global _LLM_INIT_EXECUTOR
+    with _LLM_INIT_LOCK:
+        if _LLM_INIT_EXECUTOR is None:
+            _LLM_INIT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm-init")
+        return _LLM_INIT_EXECUTOR
+
+
+# Server-suggested retry delay in quota errors: "Please retry in 37.5s" or
+# "retry_delay { seconds: 37 }". Capped so one hint can't stall a turn.
+_RETRY_AFTER_RE = re.compile(r"retry\D{0,30}?(\d+(?:\.\d+)?)", re.I)
+_MAX_RETRY_WAIT = 30.0
+# Quota errors are retried this many times after the first attempt.
+_MAX_RETRIES = 2
+# Blocking calls (`call`, `call_stream`) run on the Streamlit script thread: a server
+# hint longer than this means give up now and let the template fallback run.
+_SYNC_RETRY_BUDGET = 4.0
+
+
+def _run_sync(coro: Any) -> Any:
+    """Run a coroutine from sync code; uses a worker thread if a loop is already running."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        return ex.submit(asyncio.run, coro).result()
 
 
 class LLMClient:
     """Lightweight stub: detects env keys and returns None unless provider is configured.
 
     Keep interface simple: .has_provider and .call(prompt)->Optional[str]
+    Use `LLMClient.instance()` to share one configured client per process.
     """
 
+    _singleton: Optional["LLMClient"] = None
+    _singleton_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "LLMClient":
+        """Process-wide shared client (genai.configure resets SDK state, so configure once)."""
+        if cls._singleton is None:
+            with cls._singleton_lock:
+                if cls._singleton is None:
+                    cls._singleton = cls()
+        return cls._singleton
+
     def __init__(self) -> None:
         # Support multiple environment variable names for Gemini/OpenAI keys.
         # Prefer `GEMINI_API_KEY` (commonly used), then `GOOGLE_API_KEY`, then `OPENAI_API_KEY`.
@@ -79,111 +245,453 @@ class LLMClient:
         self.google_key = os.getenv("GOOGLE_API_KEY", "").strip()
         self.openai_key = os.getenv("OPENAI_API_KEY", "").strip()
 
-        print(f"[DEBUG] LLMClient.__init__ - GEMINI_API_KEY present: {bool(self.gemini_key)}, length: {len(self.gemini_key) if self.gemini_key else 0}")
-        print(f"[DEBUG] LLMClient.__init__ - GOOGLE_API_KEY present: {bool(self.google_key)}")
-        print(f"[DEBUG] LLMClient.__init__ - OPENAI_API_KEY present: {bool(self.openai_key)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("LLMClient.__init__ - GEMINI_API_KEY present: %s, length: %d", bool(self.gemini_key), len(self.gemini_key) if self.gemini_key else 0)
+            logger.debug("LLMClient.__init__ - GOOGLE_API_KEY present: %s", bool(self.google_key))
+            logger.debug("LLMClient.__init__ - OPENAI_API_KEY present: %s", bool(self.openai_key))
 
         # Whether we have any provider keys at all (may still fail to initialize client).
-        self.has_provider = bool(self.gemini_key or self.google_key or self.openai_key)
-        self.model = None
+        self._has_provider = bool(self.gemini_key or self.google_key or self.openai_key)
+        self._model = None
         self.llm_provider = None
-        print(f"[DEBUG] LLMClient.__init__ - has_provider: {self.has_provider}")
-
-        # Initialize Google Gemini if either GEMINI_API_KEY or GOOGLE_API_KEY is present
+        self._genai = None
+        self._init_future: Optional[Future] = None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("LLMClient.__init__ - has_provider: %s", self._has_provider)
+
+        # Initialize Google Gemini if either GEMINI_API_KEY or GOOGLE_API_KEY is present.
+        # The SDK import and model construction run on a background thread; the
+        # `has_provider` / `model` properties wait for it on first use.
         if self.gemini_key or self.google_key:
-            key = self.gemini_key or self.google_key
-            try:
-                import google.generativeai as genai
-                genai.configure(api_key=key)
-                # Use gemini-2.5-flash model (the correct current model name with DOT not hyphen)
-                try:
-                    self.model = genai.GenerativeModel('gemini-2.5-flash')
-                    self.llm_provider = 'google'
-                    print("[OK] LLMClient initialized with Gemini 2.5 Flash model")
-                except Exception as e:
-                    print(f"Warning: gemini-2.5-flash not available ({e}), trying gemini-pro...")
-                    try:
-                        self.model = genai.GenerativeModel('gemini-pro')
-                        self.llm_provider = 'google'
-                        print("[OK] LLMClient initialized with Gemini Pro model (fallback)")
-                    except Exception as e2:
-                        print(f"Warning: gemini-pro not available ({e2}), LLM disabled")
-                        self.model = None
-                        self.has_provider = False
-            except Exception as e:
-                print(f"Error: Failed to initialize Gemini API client: {e}")
-                # Keep has_provider True only if another key is present (e.g., OPENAI)
-                if not self.openai_key:
-                    self.has_provider = False
+            self._init_future = _llm_init_executor().submit(self._init_model, self.gemini_key or self.google_key)
 
         # OpenAI support placeholder: keep key for potential future use
         elif self.openai_key:
             # We don't initialize an OpenAI client here, but record presence of key.
             self.llm_provider = 'openai'
 
+    def _init_model(self, key: str) -> None:
+        # Runs on the init thread: touch only the underscored fields, never the
+        # properties (they would wait on this very future).
+        try:
+            import google.generativeai as genai
+            genai.configure(api_key=key)
+            self._genai = genai
+            # Use gemini-2.5-flash model (the correct current model name with DOT not hyphen)
+            try:
+                self._model = genai.GenerativeModel('gemini-2.5-flash')
+                self.llm_provider = 'google'
+                logger.info("LLMClient initialized with Gemini 2.5 Flash model")
+            except Exception as e:
+                logger.warning("gemini-2.5-flash not available (%s), trying gemini-pro...", e)
+                try:
+                    self._model = genai.GenerativeModel('gemini-pro')
+                    self.llm_provider = 'google'
+                    logger.info("LLMClient initialized with Gemini Pro model (fallback)")
+                except Exception as e2:
+                    logger.warning("gemini-pro not available (%s), LLM disabled", e2)
+                    self._model = None
+                    self._has_provider = False
+        except Exception as e:
+            logger.error("Failed to initialize Gemini API client: %s", e, exc_info=True)
+            # Keep has_provider True only if another key is present (e.g., OPENAI)
+            if not self.openai_key:
+                self._has_provider = False
+
+    def _wait_ready(self) -> None:
+        fut = self._init_future
+        if fut is not None:
+            fut.result()
+            self._init_future = None
+
+    @property
+    def has_provider(self) -> bool:
+        self._wait_ready()
+        return self._has_provider
+
+    @has_provider.setter
+    def has_provider(self, value: bool) -> None:
+        self._wait_ready()
+        self._has_provider = value
+
+    @property
+    def model(self) -> Any:
+        self._wait_ready()
+        return self._model
+
+    @model.setter
+    def model(self, value: Any) -> None:
+        self._wait_ready()
+        self._model = value
+
     def call(self, prompt: str, max_tokens: int = 512, temperature: float = 0.7) -> Optional[str]:
         if not self.has_provider or not self.model:
-            print(f"[DEBUG] LLM call skipped: has_provider={self.has_provider}, model={self.model is not None}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("LLM call skipped: has_provider=%s, model=%s", self.has_provider, self.model is not None)
             return None
-        
+
         # Retry logic with exponential backoff for quota errors
-        max_retries = 2
-        for attempt in range(max_retries + 1):
+        for attempt in range(_MAX_RETRIES + 1):
             try:
-                print(f"[DEBUG] Calling Gemini with model: {self.llm_provider}; max_tokens={max_tokens} (attempt {attempt+1})")
-                generation_config = {
-                    "temperature": temperature,
-                    "max_output_tokens": max_tokens,
-                }
-                response = self.model.generate_content(prompt, generation_config=generation_config)
-                result = None
-                if response:
-                    # Prefer response.text when available
-                    if getattr(response, "text", None):
-                        result = response.text.strip()
-                    else:
-                        # Fallback: stitch text from candidates parts
-                        try:
-                            parts_text = []
-                            for cand in getattr(response, "candidates", []) or []:
-                                content = getattr(cand, "content", None)
-                                for p in getattr(content, "parts", []) or []:
-                                    t = getattr(p, "text", None)
-                                    if isinstance(t, str):
-                                        parts_text.append(t)
-                            if parts_text:
-                                result = "\n".join(parts_text).strip()
-                        except Exception as pe:
-                            print(f"[DEBUG] Unable to parse candidates: {pe}")
-                print(f"[DEBUG] Gemini response length: {len(result) if result else 0}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Calling Gemini with model: %s; max_tokens=%d (attempt %d)", self.llm_provider, max_tokens, attempt + 1)
+                response = self.model.generate_content(prompt, generation_config=self._generation_config(max_tokens, temperature))
+                result = self._response_text(response)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Gemini response length: %d", len(result) if result else 0)
                 return result
             except Exception as e:
-                error_str = str(e)
-                # Check if it's a quota error (429)
-                is_quota_error = "429" in error_str or "quota" in error_str.lower()
-                print(f"[ERROR] LLM call failed (attempt {attempt+1}): {e}")
-                
-                if is_quota_error and attempt < max_retries:
-                    # Extract retry delay if available
-                    wait_time = 2 ** attempt  # exponential backoff: 1s, 2s, 4s
-                    print(f"[INFO] Quota limit hit. Waiting {wait_time}s before retry...")
+                wait_time = self._retry_wait("LLM call", e, attempt, _SYNC_RETRY_BUDGET)
+                if wait_time is None:
+                    logger.error("LLM call failed permanently. Returning None for fallback handling.")
+                    return None
+                time.sleep(wait_time)
+
+    async def call_async(self, prompt: str, max_tokens: int = 512, temperature: float = 0.7) -> Optional[str]:
+        """Async variant of `call` using Gemini's `generate_content_async`; same retry policy."""
+        if not self.has_provider or not self.model:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("LLM async call skipped: has_provider=%s, model=%s", self.has_provider, self.model is not None)
+            return None
+
+        for attempt in range(_MAX_RETRIES + 1):
+            try:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Calling Gemini (async) with model: %s; max_tokens=%d (attempt %d)", self.llm_provider, max_tokens, attempt + 1)
+                response = await self.model.generate_content_async(prompt, generation_config=self._generation_config(max_tokens, temperature))
+                result = self._response_text(response)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Gemini async response length: %d", len(result) if result else 0)
+                return result
+            except Exception as e:
+                wait_time = self._retry_wait("LLM async call", e, attempt)
+                if wait_time is None:
+                    logger.error("LLM async call failed permanently. Returning None for fallback handling.")
+                    return None
+                await asyncio.sleep(wait_time)
+
+    def embed(self, text: str) -> Optional[List[float]]:
+        """Return a Gemini text embedding for `text`, or None when embeddings are unavailable."""
+        if not self.has_provider or self._genai is None or not text:
+            return None
+        try:
+            result = self._genai.embed_content(model="models/text-embedding-004", content=text)
+            vec = result.get("embedding") if isinstance(result, dict) else getattr(result, "embedding", None)
+            return [float(x) for x in vec] if vec else None
+        except Exception as e:
+            logger.error("Embedding call failed: %s", e, exc_info=True)
+            return None
+
+    def call_stream(self, prompt: str, max_tokens: int = 512, temperature: float = 0.7) -> Iterator[str]:
+        """Yield response text chunks as Gemini streams them (nothing when no provider).
+
+        Quota errors are retried like `call`, but only before the first chunk was yielded.
+        A failure before any chunk just ends the stream (like `call` returning None); a
+        failure after some output raises `StreamInterrupted`, so callers can tell a
+        truncated response from a complete one.
+        """
+        if not self.has_provider or not self.model:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("LLM stream skipped: has_provider=%s, model=%s", self.has_provider, self.model is not None)
+            return
+
+        for attempt in range(_MAX_RETRIES + 1):
+            yielded = False
+            try:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Streaming Gemini with model: %s; max_tokens=%d (attempt %d)", self.llm_provider, max_tokens, attempt + 1)
+                for chunk in self.model.generate_content(prompt, generation_config=self._generation_config(max_tokens, temperature), stream=True):
+                    text = self._response_text(chunk, strip=False)
+                    if text:
+                        yielded = True
+                        yield text
+                return
+            except Exception as e:
+                # once output has gone to the caller a retry would repeat it
+                wait_time = self._retry_wait("LLM stream", e, attempt, _SYNC_RETRY_BUDGET, retry=not yielded)
+                if wait_time is not None:
                     time.sleep(wait_time)
                     continue
-                else:
-                    # Either not a quota error, or we've exhausted retries
-                    print(f"[ERROR] LLM call failed permanently. Returning None for fallback handling.")
-                    return None
+                if yielded:
+                    raise StreamInterrupted(f"Gemini stream ended early: {e}") from e
+                logger.error("LLM stream failed before any output. Returning nothing for fallback handling.")
+                return
+
+    @staticmethod
+    def _generation_config(max_tokens: int, temperature: float) -> Dict[str, Any]:
+        return {"temperature": temperature, "max_output_tokens": max_tokens}
+
+    @classmethod
+    def _retry_wait(cls, what: str, error: Exception, attempt: int, budget: float = _MAX_RETRY_WAIT,
+                    retry: bool = True) -> Optional[float]:
+        """Log a failed attempt; seconds to wait before the next one, or None to give up.
+
+        Shared by `call`, `call_async` and `call_stream`: only quota errors (429) are
+        retried, at most `_MAX_RETRIES` times, waiting `_retry_delay(..., budget)`.
+        """
+        logger.error("%s failed (attempt %d): %s", what, attempt + 1, error, exc_info=True)
+        error_str = str(error)
+        is_quota_error = "429" in error_str or "quota" in error_str.lower()
+        if not (retry and is_quota_error and attempt < _MAX_RETRIES):
+            return None
+        wait_time = cls._retry_delay(error, attempt, budget)
+        if wait_time is not None:
+            logger.info("Quota limit hit. Waiting %.1fs before retry...", wait_time)
+        return wait_time
+
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int, budget: float = _MAX_RETRY_WAIT) -> Optional[float]:
+        """Seconds to wait before retrying a quota error (+/-50% jitter, at most `budget`).
+
+        Uses the server's hint (a Retry-After header, or Gemini's "retry in Ns" /
+        retry_delay in the message) when present, else exponential backoff. Returns
+        None, meaning don't retry, when the server asks for longer than `budget`.
+        """
+        hint = None
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if headers:
+            hint = headers.get("Retry-After")
+        if hint is None:
+            m = _RETRY_AFTER_RE.search(str(error))
+            hint = m.group(1) if m else None
+        try:
+            wait = float(hint) if hint is not None else None
+        except ValueError:  # Retry-After may also be an HTTP date
+            wait = None
+        if wait is None:
+            wait = float(2 ** attempt)
+        elif wait > budget:
+            return None
+        return min(wait * random.uniform(0.5, 1.5), budget)
+
+    @staticmethod
+    def _response_text(response: Any, strip: bool = True) -> Optional[str]:
+        """Extract text from a Gemini response, stitching candidate parts if needed."""
+        result = None
+        if response:
+            # Prefer response.text when available (raises ValueError on part-less chunks)
+            try:
+                text = getattr(response, "text", None)
+            except ValueError:
+                text = None
+            if text:
+                result = text.strip() if strip else text
+            else:
+                # Fallback: stitch text from candidates parts
+                try:
+                    parts_text = []
+                    for cand in getattr(response, "candidates", []) or []:
+                        content = getattr(cand, "content", None)
+                        for p in getattr(content, "parts", []) or []:
+                            t = getattr(p, "text", None)
+                            if isinstance(t, str):
+                                parts_text.append(t)
+                    if parts_text:
+                        result = "\n".join(parts_text)
+                        result = result.strip() if strip else result
+                except Exception as pe:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Unable to parse candidates: %s", pe)
+        return result
+
+
+class StreamInterrupted(RuntimeError):
+    """`LLMClient.call_stream` failed after yielding part of the response."""
+
+
+class SemanticCache:
+    """Two-level cache of Coach (coaching, ideal) pairs, persisted in SQLite.
+
+    - exact layer: keyed on (question, sha1(answer)), looked up in the database
+    - semantic layer: per-question list of (embedding, coaching, ideal); a lookup
+      hits when cosine similarity to a stored answer is >= `threshold`
+
+    Entries older than `ttl` seconds are evicted every `_EVICT_EVERY` inserts.
+    `path=None` keeps the cache in memory only.
+    """
+
+    _EVICT_EVERY = 100
+    _EVICT_BATCH = 500
+
+    def __init__(self, path: Optional[str] = COACH_CACHE_DB, threshold: float = 0.92, max_per_question: int = 50,
+                 ttl: float = 30 * 24 * 3600) -> None:
+        self.path = path
+        self.threshold = threshold
+        self.max_per_question = max_per_question
+        self.ttl = ttl
+        # embeddings as float32 arrays: ~3KB per 768-d vector instead of ~24KB as a list of floats
+        self._semantic: Dict[str, List[Tuple[array, str, str]]] = {}
+        self._matrices: Dict[str, Any] = {}
+        self._lock = threading.Lock()  # Coach hits the cache from worker threads
+        self._puts = 0
+        self._db = self._connect()
+        self._load()
+
+    @staticmethod
+    def question_key(question_text: str, variant: str = "") -> str:
+        """Cache namespace for a question; `variant` splits it further (e.g. by structure issue)."""
+        key = hashlib.sha1((question_text or "").encode("utf-8")).hexdigest()
+        return key + "/" + variant if variant else key
+
+    @staticmethod
+    def _exact_key(qkey: str, answer: str) -> str:
+        return qkey + ":" + hashlib.sha1((answer or "").encode("utf-8")).hexdigest()
+
+    def get_exact(self, qkey: str, answer: str) -> Optional[Tuple[str, str]]:
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT coaching, ideal FROM feedback WHERE k = ? AND ts >= ?",
+                    (self._exact_key(qkey, answer), time.time() - self.ttl),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error("Coach cache lookup failed: %s", e, exc_info=True)
+            return None
+        return (row[0], row[1]) if row else None
+
+    def get_similar(self, qkey: str, vec: Optional[List[float]]) -> Optional[Tuple[str, str]]:
+        if not vec:
+            return None
+        # held throughout: a concurrent put may trim `entries` and drop the matrix,
+        # and `entries[best]` must index the same list the matrix was built from
+        with self._lock:
+            return self._get_similar_locked(qkey, vec)
+
+    def _get_similar_locked(self, qkey: str, vec: List[float]) -> Optional[Tuple[str, str]]:
+        entries = self._semantic.get(qkey)
+        if not entries:
+            return None
+        if np is not None:
+            m = self._matrices.get(qkey)
+            if m is None:
+                m = np.asarray([e[0] for e in entries], dtype=np.float32)
+                self._matrices[qkey] = m
+            q = np.asarray(vec, dtype=np.float32)
+            denom = np.linalg.norm(m, axis=1) * (np.linalg.norm(q) or 1.0)
+            sims = (m @ q) / np.where(denom == 0, 1.0, denom)
+            best = int(np.argmax(sims))
+            best_sim = float(sims[best])
+        else:
+            q_norm = sum(x * x for x in vec) ** 0.5 or 1.0
+            best, best_sim = 0, -1.0
+            for i, (stored, _, _) in enumerate(entries):
+                s_norm = sum(x * x for x in stored) ** 0.5 or 1.0
+                sim = sum(a * b for a, b in zip(stored, vec)) / (s_norm * q_norm)
+                if sim > best_sim:
+                    best, best_sim = i, sim
+        if best_sim >= self.threshold:
+            _, coaching, ideal = entries[best]
+            return coaching, ideal
+        return None
+
+    def put(self, qkey: str, answer: str, vec: Optional[List[float]], coaching: str, ideal: str) -> None:
+        now = time.time()
+        with self._lock:
+            if vec:
+                entries = self._semantic.setdefault(qkey, [])
+                entries.append((array("f", vec), coaching, ideal))
+                if len(entries) > self.max_per_question:
+                    del entries[: len(entries) - self.max_per_question]
+                self._matrices.pop(qkey, None)
+            self._persist(qkey, answer, vec, coaching, ideal, now)
+
+    def _persist(self, qkey: str, answer: str, vec: Optional[List[float]], coaching: str, ideal: str, now: float) -> None:
+        """Write one entry to SQLite (caller holds the lock)."""
+        try:
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO feedback (k, coaching, ideal, ts) VALUES (?, ?, ?, ?)",
+                    (self._exact_key(qkey, answer), coaching, ideal, now),
+                )
+                if vec:
+                    self._db.execute(
+                        "INSERT INTO embeddings (qkey, vec, coaching, ideal, ts) VALUES (?, ?, ?, ?, ?)",
+                        (qkey, json.dumps(list(vec), separators=(",", ":")), coaching, ideal, now),
+                    )
+                    self._db.execute(
+                        "DELETE FROM embeddings WHERE qkey = ? AND id NOT IN "
+                        "(SELECT id FROM embeddings WHERE qkey = ? ORDER BY id DESC LIMIT ?)",
+                        (qkey, qkey, self.max_per_question),
+                    )
+                self._puts += 1
+                if self._puts % self._EVICT_EVERY == 0:
+                    self._evict(now - self.ttl)
+        except sqlite3.Error as e:
+            logger.error("Unable to persist coach cache %s: %s", self.path, e, exc_info=True)
+
+    def _evict(self, cutoff: float) -> None:
+        """Drop up to `_EVICT_BATCH` expired rows per table (caller holds the lock)."""
+        self._db.execute(
+            "DELETE FROM feedback WHERE k IN (SELECT k FROM feedback WHERE ts < ? LIMIT ?)",
+            (cutoff, self._EVICT_BATCH),
+        )
+        self._db.execute(
+            "DELETE FROM embeddings WHERE id IN (SELECT id FROM embeddings WHERE ts < ? LIMIT ?)",
+            (cutoff, self._EVICT_BATCH),
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        target = self.path or ":memory:"
+        try:
+            if self.path:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            db = sqlite3.connect(target, check_same_thread=False)
+        except (OSError, sqlite3.Error) as e:
+            logger.error("Unable to open coach cache %s, using memory: %s", self.path, e, exc_info=True)
+            db = sqlite3.connect(":memory:", check_same_thread=False)
+        with db:
+            db.execute("CREATE TABLE IF NOT EXISTS feedback (k TEXT PRIMARY KEY, coaching TEXT, ideal TEXT, ts REAL)")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(id INTEGER PRIMARY KEY AUTOINCREMENT, qkey TEXT, vec TEXT, coaching TEXT, ideal TEXT, ts REAL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS embeddings_qkey ON embeddings (qkey, id)")
+        return db
+
+    def _load(self) -> None:
+        """Warm the in-memory semantic layer from unexpired embedding rows."""
+        try:
+            with self._lock:
+                rows = self._db.execute(
+                    "SELECT qkey, vec, coaching, ideal FROM embeddings WHERE ts >= ? ORDER BY id",
+                    (time.time() - self.ttl,),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error("Unable to load coach cache %s: %s", self.path, e, exc_info=True)
+            return
+        for qkey, vec, coaching, ideal in rows:
+            self._semantic.setdefault(qkey, []).append((array("f", json.loads(vec)), coaching, ideal))
 
 
 class Interviewer:
     def __init__(self, questions_path: str = QUESTIONS_FILE) -> None:
-        self.questions = _load_json_safe(questions_path)
-        self.by_difficulty = {"easy": [], "medium": [], "hard": []}
-        for q in self.questions:
-            d = q.get("difficulty", "medium")
-            if d not in self.by_difficulty:
-                d = "medium"
-            self.by_difficulty[d].append(q)
+        version = _file_version(questions_path)
+        self.questions = _load_json_cached(*version)
+        index = _index_by_difficulty(*version)
+        # difficulty -> (ids, questions), parallel tuples
+        self.by_difficulty = {d: index[d] for d in ("easy", "medium", "hard")}
+        self._all_ids = index["all"][0]
+        self._by_id = dict(zip(self._all_ids, self.questions))
+
+    def _free_lists(self, session_state: Dict[str, Any]) -> Dict[str, deque]:
+        """Per-difficulty shuffled deques of not-yet-asked ids, kept in the session."""
+        history = session_state.get("history", [])
+        free = session_state.get("_free")
+        if (
+            not isinstance(free, dict)
+            or session_state.get("_free_owner") is not self
+            or session_state.get("_free_seen", 0) > len(history)
+        ):
+            # first pick, new session, or history was reset: reshuffle the bank
+            used = {turn.get("question_id") for turn in history}
+            free = {}
+            for d, (ids, _) in self.by_difficulty.items():
+                available = [qid for qid in ids if qid not in used]
+                free[d] = deque(random.sample(available, len(available)))
+            session_state["_free"] = free
+            session_state["_free_owner"] = self
+        session_state["_free_seen"] = len(history)
+        return free
 
     def pick_question(self, session_state: Dict[str, Any]) -> Dict[str, Any]:
         last_score = session_state.get("last_overall_score")
@@ -194,15 +702,16 @@ class Interviewer:
             elif last_score < 50:
                 preferred = "easy"
 
-        bucket = self.by_difficulty.get(preferred) or self.questions
-        used = {turn.get("question_id") for turn in session_state.get("history", [])}
-        candidates = [q for q in bucket if q.get("id") not in used]
-        if not candidates:
-            candidates = [q for q in self.questions if q.get("id") not in used]
-        if not candidates:
-            candidates = bucket
+        free = self._free_lists(session_state)
+        queue = free[preferred]
+        if not queue:
+            queue = next((q for q in free.values() if q), None)
+        if queue is None:
+            # every question has been asked: start another pass over the preferred bucket
+            ids = self.by_difficulty[preferred][0] or self._all_ids
+            queue = free[preferred] = deque(random.sample(ids, len(ids)))
 
-        picked = random.choice(candidates)
+        picked = self._by_id[queue.popleft()]
         session_state["current_question_id"] = picked.get("id")
         return picked
 
@@ -228,32 +737,32 @@ class Evaluator:
         except Exception:
             # fallback default rubric
             self.rubric = {"weights": {"clarity": 40, "structure": 35, "relevance": 25}, "clarification_threshold": 45}
-        self.llm = llm_client or LLMClient()
+        self.llm = llm_client or LLMClient.instance()
         self.weights = self.rubric.get("weights", {"clarity": 40, "structure": 35, "relevance": 25})
+        # rubric weights normalized to fractions once, for the per-answer total
+        self._c_w = self.weights.get("clarity", 40) / 100.0
+        self._s_w = self.weights.get("structure", 35) / 100.0
+        self._r_w = self.weights.get("relevance", 25) / 100.0
         self.clarify_threshold = float(self.rubric.get("clarification_threshold", 45))
 
     def score(self, question_text: str, answer_text: str) -> Dict[str, Any]:
-        # Prefer LLM when available (not implemented); otherwise use heuristics.
-        if self.llm.has_provider:
-            try:
-                prompt = self._build_score_prompt(question_text, answer_text)
-                _ = self.llm.call(prompt)
-                # no provider parsing implemented — fall back
-            except Exception:
-                pass
+        # Heuristic scoring only; LLM-backed scoring lives in SessionPipeline, fused
+        # with the Coach call so a turn costs one Gemini round-trip.
+        a_feat = _analyze(answer_text)
+        q_feat = _analyze(question_text)
+        clarity = float(self._clarity_from(a_feat))
+        star_score, structure_issue = self._structure_from(a_feat)
+        relevance = float(self._relevance_from(q_feat, a_feat))
+        return self._assemble(clarity, float(star_score), structure_issue, relevance, a_feat.wc)
 
-        clarity = float(self._score_clarity(answer_text))
-        star_score, structure_issue = self._score_structure(answer_text)
-        structure = float(star_score)  # legacy key 'structure'
-        relevance = float(self._score_relevance(question_text, answer_text))
+    def _assemble(self, clarity: float, star_score: float, structure_issue: Optional[str], relevance: float, wc: int) -> Dict[str, Any]:
+        """Build the evaluation dict (weighted total, diagnostics) from per-axis scores."""
+        structure = star_score  # legacy key 'structure'
 
-        # compute weighted total using rubric weights (normalize to 0-100 scale)
-        c_w = self.weights.get("clarity", 40) / 100.0
-        s_w = self.weights.get("structure", 35) / 100.0
-        r_w = self.weights.get("relevance", 25) / 100.0
-        total = round(clarity * c_w + structure * s_w + relevance * r_w, 2)
+        # weighted total using rubric weights (normalized in __init__)
+        total = round(clarity * self._c_w + structure * self._s_w + relevance * self._r_w, 2)
 
-        clarification_needed = bool(total < self.clarify_threshold or _word_count(answer_text) < 8)
+        clarification_needed = bool(total < self.clarify_threshold or wc < 8)
 
         diagnostics = {
             "clarity": self._clarity_diagnostic(clarity),
@@ -272,50 +781,88 @@ class Evaluator:
             "structure_issue": structure_issue,
         }
 
-    def _build_score_prompt(self, question_text: str, answer_text: str) -> str:
-        return f"Score the answer 0-100 on clarity, star_structure and relevance. QUESTION: {question_text} ANSWER: {answer_text}"
-
     def _score_clarity(self, text: Optional[str]) -> int:
+        return self._clarity_from(_analyze(text))
+
+    def _score_structure(self, text: Optional[str]) -> Tuple[int, Optional[str]]:
+        return self._structure_from(_analyze(text))
+
+    def _score_relevance(self, question: str, answer: str) -> int:
+        return self._relevance_from(_analyze(question), _analyze(answer))
+
+    def _clarity_from(self, f: TextFeatures) -> int:
         # small deterministic heuristic: longer, well-formed answers tend to be clearer
-        wc = _word_count(text)
-        if wc == 0:
+        if f.wc == 0:
             return 0
-        base = min(100, 20 + wc * 4)  # incentivize some length but cap
-        fillers = len(re.findall(r"\b(um|uh|like|you know|basically|actually)\b", (text or ""), re.I))
-        score = max(0, int(base - fillers * 6))
+        base = min(100, 20 + f.wc * 4)  # incentivize some length but cap
+        score = max(0, int(base - f.fillers * 6))
         return score
 
-    def _score_structure(self, text: Optional[str]) -> Tuple[int, Optional[str]]:
-        if not text:
+    def _structure_from(self, f: TextFeatures) -> Tuple[int, Optional[str]]:
+        if f.empty:
             return 0, "missing_action"
-        lower = (text or "").lower()
-        has_action = _contains_action_words(text) or any(w in lower for w in ("action", "did", "responsible", "implemented", "led"))
-        has_result = _has_result_like_phrase(text) or any(w in lower for w in ("result", "outcome", "reduced", "improved", "increased"))
-        wc = _word_count(text)
-        if has_action and has_result:
+        if f.has_action and f.has_result:
             return 90, None
-        if has_action and not has_result:
+        if f.has_action and not f.has_result:
             return 55, "missing_result"
-        if not has_action and has_result:
+        if not f.has_action and f.has_result:
             return 50, "missing_action"
-        if wc < 12:
+        if f.wc < 12:
             return 30, "missing_action"
         return 45, "missing_action"
 
-    def _score_relevance(self, question: str, answer: str) -> int:
-        if not question or not answer:
+    def _relevance_from(self, q: TextFeatures, a: TextFeatures) -> int:
+        if q.empty or a.empty:
             return 0
-        q_words = {w for w in re.findall(r"\w+", question.lower())}
-        a_words = {w for w in re.findall(r"\w+", answer.lower())}
-        stop = {"the", "a", "an", "and", "or", "to", "of", "in", "on", "for", "with", "is", "it", "that"}
-        q_words = {w for w in q_words if w not in stop}
-        a_words = {w for w in a_words if w not in stop}
-        if not q_words:
+        if not q.tokens:
             return 50
-        overlap = q_words & a_words
-        ratio = len(overlap) / max(1, len(q_words))
+        overlap = q.tokens & a.tokens
+        ratio = len(overlap) / max(1, len(q.tokens))
         return int(min(100, ratio * 100))
 
+    def score_many(self, pairs: Sequence[Tuple[str, str]], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Score many (question, answer) pairs, in the order given.
+
+        `re` holds the GIL while matching, so large batches are spread over worker
+        processes; batches under `_SCORE_MANY_INLINE` pairs are scored in-process.
+        """
+        pairs = list(pairs)
+        workers = max_workers or min(32, os.cpu_count() or 4)
+        if workers <= 1 or len(pairs) < _SCORE_MANY_INLINE:
+            return [self.score(q, a) for q, a in pairs]
+        size = -(-len(pairs) // workers)
+        chunks = [pairs[i:i + size] for i in range(0, len(pairs), size)]
+        with ProcessPoolExecutor(max_workers=len(chunks)) as ex:
+            results = ex.map(_score_chunk, [self] * len(chunks), chunks)
+            return [r for chunk in results for r in chunk]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the LLM client owns threads and locks; worker copies only score heuristically
+        state = self.__dict__.copy()
+        state["llm"] = None
+        return state
+
+    def score_relevance_batch(self, question: str, answers: Sequence[str]) -> List[int]:
+        """Relevance of many answers to one question (bulk transcript review).
+
+        Tokens are hashed to uint64 ids and all answers are intersected with the
+        question in one `np.isin` call; without numpy this loops over `_relevance_from`.
+        """
+        q = _analyze(question)
+        if np is None or q.empty or not q.tokens:
+            return [self._relevance_from(q, _analyze(a)) for a in answers]
+
+        mask = 0xFFFFFFFFFFFFFFFF
+        q_ids = np.unique(np.fromiter((hash(w) & mask for w in q.tokens), dtype=np.uint64, count=len(q.tokens)))
+        per_answer = [set(_words(a.lower())) if a else () for a in answers]
+        lengths = np.fromiter((len(t) for t in per_answer), dtype=np.int64, count=len(per_answer))
+        all_ids = np.fromiter((hash(w) & mask for t in per_answer for w in t), dtype=np.uint64, count=int(lengths.sum()))
+        segment = np.repeat(np.arange(len(per_answer)), lengths)
+        overlap = np.bincount(segment, weights=np.isin(all_ids, q_ids), minlength=len(per_answer))
+
+        ratios = np.minimum(100.0, overlap / q_ids.size * 100.0)
+        return [int(r) if a else 0 for a, r in zip(answers, ratios)]
+
     def _clarity_diagnostic(self, score: float) -> str:
         if score < 35:
             return "Response is unclear or verbose; remove filler, use short sentences."
@@ -338,27 +885,226 @@ class Evaluator:
         return "Directly addresses the question with relevant details."
 
 
+def _score_chunk(evaluator: Evaluator, pairs: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """Process-pool entry point for `Evaluator.score_many`."""
+    return [evaluator.score(q, a) for q, a in pairs]
+
+
+# Static Coach fallbacks, built once at import instead of on every call.
+_IDEAL_TEMPLATE = """**Ideal STAR Answer Example:**
+
+**Situation:** In my previous role at [Company], we faced [specific challenge related to the question].
+
+**Task:** I was responsible for [clear objective or goal that needed to be achieved].
+
+**Action:** I took the following steps:
+- First, I analyzed [specific technical aspect] and identified [root cause]
+- Then, I implemented [specific solution with technical details]
+- I also [additional action that shows initiative]
+- Finally, I tested and validated [how you ensured quality]
+
+**Result:** This resulted in [quantified improvement - e.g., "40% performance increase", "reduced downtime by 2 hours/week", "improved user satisfaction score from 3.2 to 4.5"]. The solution was adopted across [scope of impact].
+
+Key takeaway: Always include measurable outcomes and specific technical decisions."""
+
+_COACH_FALLBACKS: Dict[Any, str] = {
+    ("star", "missing_result"): "You provided context about the situation but didn't quantify the outcome. Next time when answering behavioral questions, always end with measurable results like 'reduced response time by 40%' or 'increased user engagement by 25%'. This is good interview practice because interviewers want tangible evidence of your impact, not just descriptions of what you did.",
+    ("star", "missing_action"): "Your answer mentioned the situation but lacked specific actions you personally took. Next time when facing this type of question, try structuring your answer with clear action steps: 'I implemented X, configured Y, and tested Z.' This is good interview practice because interviewers need to understand your hands-on contributions and technical decision-making process.",
+    "clarity": "You covered the main points but the answer could be more concise and focused. Next time when answering, start with a one-sentence situation summary, then move directly to your actions and results. This is good interview practice because interviewers appreciate clear, structured responses that respect their time and make your accomplishments easy to understand.",
+    "relevance": "Your answer was well-structured but didn't fully address what the question was asking for. Next time when facing similar questions, ensure you directly answer the specific scenario requested and include relevant examples. This is good interview practice because staying on topic demonstrates your listening skills and ability to provide relevant information under pressure.",
+}
+
+# Coaching for answers that clear `Coach.llm_call_threshold` on every axis (no Gemini call).
+# Every _COACH_FALLBACKS entry is a criticism, so none of them fits here.
+_STRONG_COACHING = "Strong answer: it was clear, followed the STAR structure and stayed on the question. To keep it at this level, lead with the single result you most want remembered and keep each action tied to your own decisions. Interviewers tend to recall the first concrete number they hear, so put your strongest metric early."
+
+
 class Coach:
-    def __init__(self, templates_path: str = COACH_TEMPLATES_FILE, llm_client: Optional[LLMClient] = None) -> None:
+    def __init__(self, templates_path: str = COACH_TEMPLATES_FILE, llm_client: Optional[LLMClient] = None,
+                 cache: Optional[SemanticCache] = None, llm_call_threshold: float = 80.0) -> None:
         try:
             self.templates = _load_json_safe(templates_path)
         except Exception:
             self.templates = {}
-        self.llm = llm_client or LLMClient()
+        self.llm = llm_client or LLMClient.instance()
+        self.cache = cache if cache is not None else SemanticCache()
+        # answers scoring at least this on every axis get template feedback (no Gemini call)
+        self.llm_call_threshold = llm_call_threshold
+
+    def _needs_llm(self, evaluation_result: Dict[str, Any]) -> bool:
+        """False when the answer is already strong enough that template feedback will do."""
+        if evaluation_result.get("structure_issue"):
+            return True
+        clarity = evaluation_result.get("clarity", 0)
+        star = evaluation_result.get("star_structure", evaluation_result.get("structure", 0))
+        relevance = evaluation_result.get("relevance", 0)
+        return min(clarity, star, relevance) < self.llm_call_threshold
+
+    def _strong_answer_feedback(self, question_text: str, user_answer: str) -> Tuple[str, str]:
+        """(coaching, ideal) for an answer that skipped Gemini because it was already strong."""
+        return (_STRONG_COACHING, self._fallback_ideal_answer(question_text, user_answer))
+
+    @staticmethod
+    def _cache_qkey(question_text: str, evaluation_result: Dict[str, Any]) -> str:
+        """Cache namespace for feedback: the question plus the structure issue the coaching targets.
+
+        Keeps a near-duplicate answer that fixed (say) a missing result from semantically
+        inheriting "you didn't quantify the outcome" coaching.
+        """
+        return SemanticCache.question_key(question_text, evaluation_result.get("structure_issue") or "")
+
+    def _cache_lookup(self, question_text: str, user_answer: str, evaluation_result: Dict[str, Any]) -> Tuple[Optional[Tuple[str, str]], Optional[List[float]]]:
+        """Return (cached feedback or None, answer embedding or None) for this question/answer.
+
+        A failing lookup (SQLite error, embedding shape mismatch, ...) is logged and
+        treated as a miss so the caller still asks Gemini; no embedding is returned
+        then, so a vector the semantic layer can't compare is not stored.
+        """
+        qkey = self._cache_qkey(question_text, evaluation_result)
+        try:
+            hit = self.cache.get_exact(qkey, user_answer)
+            if hit:
+                logger.info("Coach cache hit (exact)")
+                return hit, None
+            vec = self.llm.embed(user_answer)
+            hit = self.cache.get_similar(qkey, vec)
+        except Exception as e:
+            logger.error("Coach cache lookup failed, treating as a miss: %s", e, exc_info=True)
+            return None, None
+        if hit:
+            logger.info("Coach cache hit (semantic)")
+        return hit, vec
+
+    def _cache_store(self, question_text: str, user_answer: str, evaluation_result: Dict[str, Any],
+                     vec: Optional[List[float]], feedback: Tuple[str, str]) -> None:
+        self.cache.put(self._cache_qkey(question_text, evaluation_result), user_answer, vec, feedback[0], feedback[1])
 
     def _generate_combined_feedback(self, question_text: str, user_answer: str, evaluation_result: Dict[str, Any]) -> Tuple[str, str]:
         """Generate both personalized coaching and ideal answer in ONE LLM call to save quota."""
+        try:
+            events = dict(self._generate_combined_feedback_stream(question_text, user_answer, evaluation_result))
+            return (events["coaching"], events["ideal"])
+        except Exception as e:
+            logger.error("Combined feedback generation failed: %s", e, exc_info=True)
+            return self._finish_combined(None, question_text, user_answer, evaluation_result)
+
+    def _generate_combined_feedback_stream(self, question_text: str, user_answer: str, evaluation_result: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
+        """Yield ("coaching", text) then ("ideal", text) for progressive display.
+
+        The coaching event is emitted as soon as the IDEAL_ANSWER: sentinel arrives
+        in the Gemini stream, before the ideal answer has finished generating.
+        """
+        if not self._needs_llm(evaluation_result):
+            logger.info("Strong answer - skipping Gemini")
+            coaching, ideal = self._strong_answer_feedback(question_text, user_answer)
+            yield ("coaching", coaching)
+            yield ("ideal", ideal)
+            return
         if not self.llm.has_provider:
-            print("[INFO] LLM not available - using template feedback")
-            return (self._fallback_personalized_coaching(user_answer, evaluation_result),
-                    self._fallback_ideal_answer(question_text, user_answer))
-        
+            logger.info("LLM not available - using template feedback")
+            coaching, ideal = self._finish_combined(None, question_text, user_answer, evaluation_result)
+            yield ("coaching", coaching)
+            yield ("ideal", ideal)
+            return
+
+        cached, vec = self._cache_lookup(question_text, user_answer, evaluation_result)
+        if cached:
+            yield ("coaching", cached[0])
+            yield ("ideal", cached[1])
+            return
+
+        prompt = self._build_combined_prompt(question_text, user_answer, evaluation_result)
+        sentinel = "IDEAL_ANSWER:"
+        text = ""
+        early_coaching: Optional[str] = None
+        try:
+            for chunk in self.llm.call_stream(prompt, max_tokens=2048, temperature=0.7):
+                scan_from = max(0, len(text) - len(sentinel))
+                text += chunk
+                if early_coaching is None:
+                    idx = text.find(sentinel, scan_from)
+                    if idx != -1:
+                        candidate = text[:idx].replace("COACHING:", "").strip()
+                        if len(candidate) >= 20:
+                            early_coaching = candidate
+                            yield ("coaching", early_coaching)
+        except StreamInterrupted as e:
+            # Only the coaching section is known to be complete (the sentinel followed it);
+            # the ideal answer is cut off. Use templates for what didn't finish and don't
+            # cache the truncated response.
+            logger.error("%s - using template feedback for unfinished sections", e)
+            coaching, ideal = self._finish_combined(None, question_text, user_answer, evaluation_result)
+            if early_coaching is None:
+                yield ("coaching", coaching)
+            yield ("ideal", ideal)
+            return
+
+        response = text.strip() or None
+        coaching, ideal = self._finish_combined(response, question_text, user_answer, evaluation_result)
+        if early_coaching is None:
+            yield ("coaching", coaching)
+        else:
+            coaching = early_coaching
+        yield ("ideal", ideal)
+        if response:
+            self._cache_store(question_text, user_answer, evaluation_result, vec, (coaching, ideal))
+
+    async def _generate_combined_feedback_async(self, question_text: str, user_answer: str, evaluation_result: Dict[str, Any]) -> Tuple[str, str]:
+        """Async twin of `_generate_combined_feedback` built on `LLMClient.call_async`."""
+        if not self._needs_llm(evaluation_result):
+            return self._strong_answer_feedback(question_text, user_answer)
+        if not self.llm.has_provider:
+            return self._finish_combined(None, question_text, user_answer, evaluation_result)
+
+        cached, vec = await asyncio.to_thread(self._cache_lookup, question_text, user_answer, evaluation_result)
+        if cached:
+            return cached
+
+        prompt = self._build_combined_prompt(question_text, user_answer, evaluation_result)
+        try:
+            response = await self.llm.call_async(prompt, max_tokens=2048, temperature=0.7)
+            feedback = self._finish_combined(response, question_text, user_answer, evaluation_result)
+            if response:
+                self._cache_store(question_text, user_answer, evaluation_result, vec, feedback)
+            return feedback
+        except Exception as e:
+            logger.error("Combined feedback generation (async) failed: %s", e, exc_info=True)
+            return self._finish_combined(None, question_text, user_answer, evaluation_result)
+
+    async def generate_feedback_batch(self, triples: Sequence[Tuple[str, str, Dict[str, Any]]], max_concurrency: int = 8) -> List[Tuple[str, str]]:
+        """Generate (coaching, ideal) for many (question_text, user_answer, evaluation_result) triples.
+
+        Gemini calls are fanned out concurrently, at most `max_concurrency` in flight.
+        Failed calls fall back to template feedback for that item only.
+        """
+        triples = list(triples)
+        sem = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _one(q: str, a: str, r: Dict[str, Any]) -> Tuple[str, str]:
+            async with sem:
+                return await self._generate_combined_feedback_async(q, a, r)
+
+        outcomes = await asyncio.gather(*[_one(q, a, r) for q, a, r in triples], return_exceptions=True)
+
+        results: List[Tuple[str, str]] = []
+        for (q, a, r), outcome in zip(triples, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("Batched feedback generation failed: %s", outcome)
+                outcome = self._finish_combined(None, q, a, r)
+            results.append(outcome)
+        return results
+
+    def generate_feedback_batch_sync(self, triples: Sequence[Tuple[str, str, Dict[str, Any]]], max_concurrency: int = 8) -> List[Tuple[str, str]]:
+        """Blocking wrapper around `generate_feedback_batch` for callers without an event loop."""
+        return _run_sync(self.generate_feedback_batch(triples, max_concurrency=max_concurrency))
+
+    def _build_combined_prompt(self, question_text: str, user_answer: str, evaluation_result: Dict[str, Any]) -> str:
         clarity = evaluation_result.get("clarity", 0)
         star = evaluation_result.get("star_structure", evaluation_result.get("structure", 0))
         relevance = evaluation_result.get("relevance", 0)
         diagnostics = evaluation_result.get("diagnostics", {})
-        
-        prompt = f"""You are an expert interview coach. Provide TWO outputs:
+
+        return f"""You are an expert interview coach. Provide TWO outputs:
 
 1. PERSONALIZED COACHING: Provide feedback in this format:
    "You answered by [summarize]. However, [main weakness]. Next time when facing [type], try answering like this: [specific guidance]. This is good interview practice because [why]."
@@ -381,89 +1127,77 @@ COACHING:
 IDEAL_ANSWER:
 [your ideal STAR answer here]
 """
-        
-        try:
-            response = self.llm.call(prompt, max_tokens=2048, temperature=0.7)
-            if not response:
-                print("[INFO] Gemini returned empty response (likely quota exceeded) - using template feedback")
-                return (self._fallback_personalized_coaching(user_answer, evaluation_result),
-                        self._fallback_ideal_answer(question_text, user_answer))
-            
-            print(f"[DEBUG] Raw Gemini response (first 300 chars): {response[:300]}")
-            
-            # Parse response into two parts - try multiple strategies
-            coaching = ""
-            ideal = ""
-            
-            # Strategy 1: Split by IDEAL_ANSWER:
-            if "IDEAL_ANSWER:" in response:
-                parts = response.split("IDEAL_ANSWER:")
-                if len(parts) == 2:
-                    coaching_part = parts[0].replace("COACHING:", "").strip()
-                    ideal_part = parts[1].strip()
-                    coaching = coaching_part if coaching_part else ""
-                    ideal = ideal_part if ideal_part else ""
-            
-            # Strategy 2: If first strategy didn't work, try case-insensitive or line-based parsing
-            if not coaching or not ideal:
-                lines = response.split('\n')
-                in_coaching = False
-                in_ideal = False
-                coaching_lines = []
-                ideal_lines = []
-                
-                for line in lines:
-                    if 'coaching:' in line.lower():
-                        in_coaching = True
-                        in_ideal = False
-                        continue
-                    if 'ideal_answer:' in line.lower():
-                        in_ideal = True
-                        in_coaching = False
-                        continue
-                    
-                    if in_coaching and line.strip():
-                        coaching_lines.append(line)
-                    elif in_ideal and line.strip():
-                        ideal_lines.append(line)
-                
-                coaching = '\n'.join(coaching_lines).strip() if coaching_lines else coaching
-                ideal = '\n'.join(ideal_lines).strip() if ideal_lines else ideal
-            
-            # Strategy 3: If still empty, use entire response as coaching
-            if not coaching:
-                coaching = response.strip()
-            
-            # Use fallbacks only if parsing yielded nothing meaningful
-            if len(coaching.strip()) < 20:
-                coaching = self._fallback_personalized_coaching(user_answer, evaluation_result)
-            if len(ideal.strip()) < 20:
-                ideal = self._fallback_ideal_answer(question_text, user_answer)
-            
-            print(f"[DEBUG] Parsed coaching length: {len(coaching)}, ideal length: {len(ideal)}")
-            return (coaching, ideal)
-        except Exception as e:
-            print(f"[ERROR] Combined feedback generation failed: {e}")
+
+    def _parse_combined(self, response: str) -> Tuple[str, str]:
+        """Split a combined COACHING/IDEAL_ANSWER response; either part may come back empty."""
+        coaching = ""
+        ideal = ""
+
+        # Strategy 1: Split by IDEAL_ANSWER:
+        if "IDEAL_ANSWER:" in response:
+            parts = response.split("IDEAL_ANSWER:")
+            if len(parts) == 2:
+                coaching_part = parts[0].replace("COACHING:", "").strip()
+                ideal_part = parts[1].strip()
+                coaching = coaching_part if coaching_part else ""
+                ideal = ideal_part if ideal_part else ""
+
+        # Strategy 2: If first strategy didn't work, try case-insensitive or line-based parsing
+        if not coaching or not ideal:
+            lines = response.split('\n')
+            in_coaching = False
+            in_ideal = False
+            coaching_lines = []
+            ideal_lines = []
+
+            for line in lines:
+                if 'coaching:' in line.lower():
+                    in_coaching = True
+                    in_ideal = False
+                    continue
+                if 'ideal_answer:' in line.lower():
+                    in_ideal = True
+                    in_coaching = False
+                    continue
+
+                if in_coaching and line.strip():
+                    coaching_lines.append(line)
+                elif in_ideal and line.strip():
+                    ideal_lines.append(line)
+
+            coaching = '\n'.join(coaching_lines).strip() if coaching_lines else coaching
+            ideal = '\n'.join(ideal_lines).strip() if ideal_lines else ideal
+
+        # Strategy 3: If still empty, use entire response as coaching
+        if not coaching:
+            coaching = response.strip()
+
+        return coaching, ideal
+
+    def _finish_combined(self, response: Optional[str], question_text: str, user_answer: str, evaluation_result: Dict[str, Any]) -> Tuple[str, str]:
+        """Parse an LLM response into (coaching, ideal), substituting templates for missing parts."""
+        if not response:
+            logger.info("No Gemini response - using template feedback")
             return (self._fallback_personalized_coaching(user_answer, evaluation_result),
                     self._fallback_ideal_answer(question_text, user_answer))
-    
-    def _fallback_ideal_answer(self, question_text: str, user_answer: str) -> str:
-        """Generate a structured ideal answer template when LLM unavailable."""
-        return """**Ideal STAR Answer Example:**
 
-**Situation:** In my previous role at [Company], we faced [specific challenge related to the question].
-
-**Task:** I was responsible for [clear objective or goal that needed to be achieved].
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw Gemini response (first 300 chars): %s", response[:300])
+        coaching, ideal = self._parse_combined(response)
 
-**Action:** I took the following steps:
-- First, I analyzed [specific technical aspect] and identified [root cause]
-- Then, I implemented [specific solution with technical details]
-- I also [additional action that shows initiative]
-- Finally, I tested and validated [how you ensured quality]
+        # Use fallbacks only if parsing yielded nothing meaningful
+        if len(coaching.strip()) < 20:
+            coaching = self._fallback_personalized_coaching(user_answer, evaluation_result)
+        if len(ideal.strip()) < 20:
+            ideal = self._fallback_ideal_answer(question_text, user_answer)
 
-**Result:** This resulted in [quantified improvement - e.g., "40% performance increase", "reduced downtime by 2 hours/week", "improved user satisfaction score from 3.2 to 4.5"]. The solution was adopted across [scope of impact].
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Parsed coaching length: %d, ideal length: %d", len(coaching), len(ideal))
+        return (coaching, ideal)
 
-Key takeaway: Always include measurable outcomes and specific technical decisions."""
+    def _fallback_ideal_answer(self, question_text: str, user_answer: str) -> str:
+        """Generate a structured ideal answer template when LLM unavailable."""
+        return _IDEAL_TEMPLATE
     
     def _generate_personalized_coaching(self, question_text: str, user_answer: str, evaluation_result: Dict[str, Any]) -> str:
         """Generate personalized coaching using LLM or fallback to template."""
@@ -508,7 +1242,7 @@ Requirements:
             if response and len(response) > 50:
                 return response
         except Exception as e:
-            print(f"Personalized coaching generation failed: {e}")
+            logger.warning("Personalized coaching generation failed: %s", e)
         
         return self._fallback_personalized_coaching(user_answer, evaluation_result)
     
@@ -520,20 +1254,32 @@ Requirements:
         structure_issue = evaluation_result.get("structure_issue")
         
         if star < clarity and star < relevance:
-            if structure_issue == "missing_result":
-                return "You provided context about the situation but didn't quantify the outcome. Next time when answering behavioral questions, always end with measurable results like 'reduced response time by 40%' or 'increased user engagement by 25%'. This is good interview practice because interviewers want tangible evidence of your impact, not just descriptions of what you did."
-            else:
-                return "Your answer mentioned the situation but lacked specific actions you personally took. Next time when facing this type of question, try structuring your answer with clear action steps: 'I implemented X, configured Y, and tested Z.' This is good interview practice because interviewers need to understand your hands-on contributions and technical decision-making process."
+            key = ("star", "missing_result" if structure_issue == "missing_result" else "missing_action")
         elif clarity < star and clarity < relevance:
-            return "You covered the main points but the answer could be more concise and focused. Next time when answering, start with a one-sentence situation summary, then move directly to your actions and results. This is good interview practice because interviewers appreciate clear, structured responses that respect their time and make your accomplishments easy to understand."
+            key = "clarity"
         else:
-            return "Your answer was well-structured but didn't fully address what the question was asking for. Next time when facing similar questions, ensure you directly answer the specific scenario requested and include relevant examples. This is good interview practice because staying on topic demonstrates your listening skills and ability to provide relevant information under pressure."
+            key = "relevance"
+        return _COACH_FALLBACKS[key]
 
     def generate_feedback(self, question_text: Any, user_answer: str, evaluation_result: Dict[str, Any], model_answer: str = "") -> Dict[str, str]:
         if isinstance(question_text, dict):
             model_answer = question_text.get("model_answer", model_answer)
             question_text = question_text.get("text", "")
 
+        feedback = self._template_feedback(evaluation_result, model_answer)
+        if not self._needs_llm(evaluation_result):
+            # deliberate skip, not a failure: tell the UI so it doesn't show the fallback banners
+            feedback["source"] = "skipped_strong"
+
+        # Generate BOTH personalized coaching and ideal answer in ONE LLM call to conserve quota
+        personalized_coaching, ideal_answer = self._generate_combined_feedback(question_text, user_answer, evaluation_result)
+
+        feedback["personalized_coaching"] = personalized_coaching
+        feedback["ideal_answer"] = ideal_answer
+        return feedback
+
+    def _template_feedback(self, evaluation_result: Dict[str, Any], model_answer: str = "") -> Dict[str, str]:
+        """Improvement bullet, practice prompt and model answer picked from templates (no LLM)."""
         clarity = evaluation_result.get("clarity", 0)
         star = evaluation_result.get("star_structure", evaluation_result.get("structure", 0))
         relevance = evaluation_result.get("relevance", 0)
@@ -569,24 +1315,107 @@ Requirements:
                 m_answer = model_tmpl
         else:
             m_answer = "S: [Situation]\nT: [Task]\nA: [Action — what you did]\nR: [Result — measurable outcome]"
-        
-        # Generate BOTH personalized coaching and ideal answer in ONE LLM call to conserve quota
-        personalized_coaching, ideal_answer = self._generate_combined_feedback(question_text, user_answer, evaluation_result)
 
         return {
             "improvement_bullet": improvement,
             "model_answer": m_answer,
             "practice_prompt": practice,
-            "personalized_coaching": personalized_coaching,
-            "ideal_answer": ideal_answer
         }
 
 
-__all__ = ["Interviewer", "Evaluator", "Coach", "LLMClient"]
+class SessionPipeline:
+    """Evaluator + Coach for one turn using a single Gemini round-trip.
+
+    With a provider, one prompt asks for scores, coaching and an ideal answer as
+    JSON. Without one (or if the reply can't be parsed) the heuristic Evaluator
+    and template feedback are used, so no second request is made.
+    """
+
+    def __init__(self, evaluator: Optional[Evaluator] = None, coach: Optional[Coach] = None,
+                 llm_client: Optional[LLMClient] = None) -> None:
+        self.llm = llm_client or (evaluator.llm if evaluator else coach.llm if coach else LLMClient.instance())
+        self.evaluator = evaluator or Evaluator(llm_client=self.llm)
+        self.coach = coach or Coach(llm_client=self.llm)
+
+    def evaluate_and_coach(self, question: Any, answer: str) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Return (evaluation_result, feedback) shaped like Evaluator.score / Coach.generate_feedback."""
+        model_answer = ""
+        question_text = question
+        if isinstance(question, dict):
+            model_answer = question.get("model_answer", "")
+            question_text = question.get("text", "")
+
+        if not self.llm.has_provider:
+            evaluation = self.evaluator.score(question_text, answer)
+            return evaluation, self.coach.generate_feedback(question_text, answer, evaluation, model_answer)
+
+        parsed = self._parse_json(self.llm.call(self._build_prompt(question_text, answer), max_tokens=2048, temperature=0.7))
+
+        # STAR issue and word count stay heuristic; the LLM supplies the axis scores.
+        a_feat = _analyze(answer)
+        q_feat = _analyze(question_text)
+        star_heuristic, structure_issue = self.evaluator._structure_from(a_feat)
+        clarity = self._axis(parsed, "clarity", self.evaluator._clarity_from(a_feat))
+        star = self._axis(parsed, "star", star_heuristic)
+        relevance = self._axis(parsed, "relevance", self.evaluator._relevance_from(q_feat, a_feat))
+        evaluation = self.evaluator._assemble(clarity, star, structure_issue, relevance, a_feat.wc)
+
+        feedback = self.coach._template_feedback(evaluation, model_answer)
+        coaching = str(parsed.get("coaching") or "").strip()
+        ideal = str(parsed.get("ideal_answer") or "").strip()
+        if len(coaching) < 20:
+            coaching = self.coach._fallback_personalized_coaching(answer, evaluation)
+        if len(ideal) < 20:
+            ideal = self.coach._fallback_ideal_answer(question_text, answer)
+        feedback["personalized_coaching"] = coaching
+        feedback["ideal_answer"] = ideal
+        return evaluation, feedback
+
+    def _build_prompt(self, question_text: str, answer: str) -> str:
+        return f"""You are an expert interview coach. Evaluate the candidate's answer and coach them.
+
+QUESTION: {question_text}
+
+CANDIDATE'S ANSWER: {answer}
+
+Respond with ONLY a JSON object with these keys:
+- "clarity": integer 0-100, how clear and concise the answer is
+- "star": integer 0-100, how well it follows Situation-Task-Action-Result
+- "relevance": integer 0-100, how directly it addresses the question
+- "coaching": personalized feedback in this format: "You answered by [summarize]. However, [main weakness]. Next time when facing [type], try answering like this: [specific guidance]. This is good interview practice because [why]."
+- "ideal_answer": a perfect STAR-format answer for this question
+"""
+
+    @staticmethod
+    def _parse_json(response: Optional[str]) -> Dict[str, Any]:
+        if not response:
+            return {}
+        start, end = response.find("{"), response.rfind("}")
+        if start == -1 or end <= start:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Pipeline response has no JSON object (first 300 chars): %s", response[:300])
+            return {}
+        try:
+            parsed = json.loads(response[start:end + 1])
+        except ValueError as e:
+            logger.error("Unable to parse pipeline JSON: %s", e, exc_info=True)
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+
+    @staticmethod
+    def _axis(parsed: Dict[str, Any], key: str, default: float) -> float:
+        try:
+            return float(min(100, max(0, float(parsed[key]))))
+        except (KeyError, TypeError, ValueError):
+            return float(default)
+
+
+__all__ = ["Interviewer", "Evaluator", "Coach", "LLMClient", "SessionPipeline"]
 
 
 if __name__ == "__main__":
     # quick smoke demo when invoked directly
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
     interviewer = Interviewer()
     evaluator = Evaluator()
     coach = Coach()
@@ -6,7 +6,7 @@ Streamlit front-end for SkillBridge MVP.
 
 - Runs entirely in a single process (Streamlit).
 - Uses agent_core.Interviewer, Evaluator, Coach.
-- Saves per-turn logs to logs/session_logs.json.
+- Saves per-turn logs to logs/session_logs.jsonl (one JSON object per line).
 - Provides:
     - Start/Reset session controls
     - Chat-like interface for questions & answers
@@ -19,536 +19,544 @@ How to run:
     streamlit run app.py
 """
 
+import atexit
+import inspect
 import os
 import json
+import logging
+import queue
+import threading
 import time
-from typing import Dict, Any, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
 import streamlit as st
 
-# Load environment variables from .env file (for GEMINI_API_KEY)
+# Loads environment variables from .env file (for GEMINI_API_KEY), see _bootstrap
 from dotenv import load_dotenv
-load_dotenv()
-print(f"[INIT] Environment loaded. GEMINI_API_KEY present: {bool(os.getenv('GEMINI_API_KEY'))}")
 
 # Import agents from your agent_core.py
 from agent_core import Interviewer, Evaluator, Coach
 
+logger = logging.getLogger(__name__)
+
 # ---------------------------
 # MUST BE FIRST: Page Config
 # ---------------------------
 st.set_page_config(page_title="SkillBridge", layout="wide", initial_sidebar_state="expanded")
 
-# Safe wrapper for streamlit.experimental_rerun() which may not exist in
-# all streamlit versions or environments (avoid AttributeError during tests).
+# Safe wrapper for st.rerun() (st.experimental_rerun() in older versions), which
+# may not exist in all streamlit versions or environments (avoid AttributeError
+# during tests). Resolved once here rather than on every call.
+_RERUN = getattr(st, "rerun", None) or getattr(st, "experimental_rerun", None)
+if not callable(_RERUN):
+    _RERUN = None
+
 def _safe_rerun() -> None:
+    if _RERUN is None:
+        return
     try:
-        rerun = getattr(st, "experimental_rerun", None)
-        if callable(rerun):
-            rerun()
+        _RERUN()
     except Exception:
-        # swallow to keep the app usable in environments without experimental API
+        # swallow to keep the app usable; Streamlit's rerun signal is a
+        # BaseException and still propagates
         return
 
+# st.fragment (st.experimental_fragment before 1.37) reruns just the decorated
+# function when its own widgets change; older versions fall back to a plain call.
+_FRAGMENT = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda fn: fn)
+
+# ---------------------------
+# Setup env, paths & ensure folders (once per process; Streamlit
+# re-executes this script on every interaction)
+# ---------------------------
+@st.cache_resource(show_spinner=False)
+def _bootstrap() -> Dict[str, str]:
+    load_dotenv()
+    print(f"[INIT] Environment loaded. GEMINI_API_KEY present: {bool(os.getenv('GEMINI_API_KEY'))}")
+    root = os.path.dirname(os.path.abspath(__file__))
+    paths = {
+        "ROOT": root,
+        "LOGS_DIR": os.path.join(root, "logs"),
+        "DEMO_DIR": os.path.join(root, "demo_cases"),
+        "STATIC_DIR": os.path.join(root, "static"),
+    }
+    os.makedirs(paths["LOGS_DIR"], exist_ok=True)
+    os.makedirs(paths["DEMO_DIR"], exist_ok=True)
+    return paths
+
+_PATHS = _bootstrap()
+ROOT = _PATHS["ROOT"]
+LOGS_DIR = _PATHS["LOGS_DIR"]
+DEMO_DIR = _PATHS["DEMO_DIR"]
+STATIC_DIR = _PATHS["STATIC_DIR"]
+
+SESSION_LOG_FILE = os.path.join(LOGS_DIR, "session_logs.jsonl")
+LEGACY_SESSION_LOG_FILE = os.path.join(LOGS_DIR, "session_logs.json")
+
 # ---------------------------
 # Inject Custom CSS & Styling
 # ---------------------------
+@st.cache_data
+def _load_css() -> str:
+    with open(os.path.join(STATIC_DIR, "skillbridge.css"), "r", encoding="utf-8") as f:
+        return f"<style>\n{f.read()}</style>"
+
 def inject_custom_css():
-    """Inject professional custom CSS for enhanced UI."""
-    st.markdown("""
-    <style>
-        /* Main header with gradient */
-        .main-header {
-            background: linear-gradient(135deg, #2E5BFF 0%, #8B5CF6 100%);
-            padding: 2rem;
-            border-radius: 15px;
-            color: white;
-            text-align: center;
-            margin-bottom: 2rem;
-            box-shadow: 0 10px 30px rgba(46, 91, 255, 0.3);
-            animation: fadeIn 0.8s ease-in;
-        }
-        
-        .main-header h1 {
-            margin: 0;
-            font-size: 2.5rem;
-            font-weight: 700;
-        }
-        
-        .main-header .tagline {
-            font-size: 1.2rem;
-            margin-top: 0.5rem;
-            opacity: 0.95;
-            font-weight: 500;
-        }
-        
-        .main-header .subtext {
-            font-size: 0.95rem;
-            opacity: 0.85;
-            margin-top: 0.5rem;
-        }
-        
-        /* Feedback cards */
-        .feedback-card {
-            background: linear-gradient(135deg, rgba(46, 91, 255, 0.1) 0%, rgba(139, 92, 246, 0.05) 100%);
-            border-left: 4px solid #2E5BFF;
-            padding: 1.5rem;
-            border-radius: 12px;
-            margin: 1rem 0;
-            box-shadow: 0 4px 15px rgba(46, 91, 255, 0.1);
-            transition: all 0.3s ease;
-            animation: slideIn 0.5s ease-out;
-        }
-        
-        .feedback-card:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 8px 25px rgba(46, 91, 255, 0.2);
-        }
-        
-        .feedback-card.success {
-            border-left-color: #00D084;
-            background: linear-gradient(135deg, rgba(0, 208, 132, 0.1) 0%, rgba(0, 208, 132, 0.05) 100%);
-        }
-        
-        .feedback-card.warning {
-            border-left-color: #FF9F1C;
-            background: linear-gradient(135deg, rgba(255, 159, 28, 0.1) 0%, rgba(255, 159, 28, 0.05) 100%);
-        }
-        
-        /* Score badges */
-        .score-badge {
-            display: inline-block;
-            padding: 0.5rem 1rem;
-            border-radius: 25px;
-            font-weight: 600;
-            font-size: 0.9rem;
-            animation: fadeIn 0.5s ease-in;
-        }
-        
-        .score-excellent {
-            background: linear-gradient(135deg, #00D084 0%, #00B570 100%);
-            color: white;
-            box-shadow: 0 4px 15px rgba(0, 208, 132, 0.3);
-        }
-        
-        .score-good {
-            background: linear-gradient(135deg, #2E5BFF 0%, #1e40af 100%);
-            color: white;
-            box-shadow: 0 4px 15px rgba(46, 91, 255, 0.3);
-        }
-        
-        .score-needs-work {
-            background: linear-gradient(135deg, #FF9F1C 0%, #f97316 100%);
-            color: white;
-            box-shadow: 0 4px 15px rgba(255, 159, 28, 0.3);
-        }
-        
-        /* Progress bars */
-        .skill-progress {
-            background: rgba(0, 0, 0, 0.1);
-            border-radius: 10px;
-            height: 12px;
-            overflow: hidden;
-            margin: 0.5rem 0;
-            box-shadow: inset 0 2px 4px rgba(0, 0, 0, 0.1);
-        }
-        
-        .skill-progress-fill {
-            height: 100%;
-            background: linear-gradient(90deg, #2E5BFF 0%, #8B5CF6 100%);
-            border-radius: 10px;
-            transition: width 1s cubic-bezier(0.25, 0.46, 0.45, 0.94);
-        }
-        
-        /* Welcome card */
-        .welcome-card {
-            background: linear-gradient(135deg, rgba(46, 91, 255, 0.05) 0%, rgba(139, 92, 246, 0.05) 100%);
-            border: 2px solid rgba(46, 91, 255, 0.2);
-            padding: 2rem;
-            border-radius: 15px;
-            margin-bottom: 2rem;
-        }
-        
-        .welcome-card h2 {
-            color: #2E5BFF;
-            margin-top: 0;
-        }
-        
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(3, 1fr);
-            gap: 1rem;
-            margin-top: 1.5rem;
-        }
-        
-        .stat-item {
-            background: rgba(46, 91, 255, 0.08);
-            padding: 1.5rem;
-            border-radius: 12px;
-            text-align: center;
-            border: 1px solid rgba(46, 91, 255, 0.15);
-            transition: all 0.3s ease;
-        }
-        
-        .stat-item:hover {
-            background: rgba(46, 91, 255, 0.12);
-            transform: translateY(-3px);
-        }
-        
-        .stat-number {
-            font-size: 2rem;
-            font-weight: 700;
-            color: #2E5BFF;
-            margin: 0.5rem 0;
-        }
-        
-        .stat-label {
-            font-size: 0.9rem;
-            color: rgba(255, 255, 255, 0.7);
-        }
-        
-        /* Performance metrics */
-        .performance-metric {
-            margin: 1rem 0;
-            padding: 0.75rem;
-            background: rgba(46, 91, 255, 0.05);
-            border-radius: 8px;
-            transition: all 0.2s ease;
-        }
-        
-        .performance-metric:hover {
-            background: rgba(46, 91, 255, 0.1);
-        }
-        
-        .metric-row {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 0.5rem;
-        }
-        
-        .metric-label {
-            font-weight: 600;
-            flex: 1;
-        }
-        
-        /* Animations */
-        @keyframes fadeIn {
-            from {
-                opacity: 0;
-            }
-            to {
-                opacity: 1;
-            }
-        }
-        
-        @keyframes slideIn {
-            from {
-                opacity: 0;
-                transform: translateY(10px);
-            }
-            to {
-                opacity: 1;
-                transform: translateY(0);
-            }
-        }
-        
-        @keyframes slideInLeft {
-            from {
-                opacity: 0;
-                transform: translateX(-20px);
-            }
-            to {
-                opacity: 1;
-                transform: translateX(0);
-            }
-        }
-        
-        /* Chat history styling */
-        .chat-message {
-            padding: 1rem;
-            margin: 0.75rem 0;
-            border-radius: 10px;
-            background: rgba(46, 91, 255, 0.05);
-            border-left: 3px solid #2E5BFF;
-            animation: slideInLeft 0.4s ease-out;
-        }
-        
-        .chat-message.question {
-            border-left-color: #2E5BFF;
-        }
-        
-        .chat-message.answer {
-            border-left-color: #8B5CF6;
-            margin-left: 1rem;
-        }
-        
-        /* Buttons */
-        .stButton > button {
-            background: linear-gradient(135deg, #2E5BFF 0%, #8B5CF6 100%) !important;
-            color: white !important;
-            border: none !important;
-            padding: 0.75rem 2rem !important;
-            border-radius: 25px !important;
-            font-weight: 600 !important;
-            transition: all 0.3s ease !important;
-            box-shadow: 0 4px 15px rgba(46, 91, 255, 0.3) !important;
-        }
-        
-        .stButton > button:hover {
-            transform: translateY(-2px) !important;
-            box-shadow: 0 6px 20px rgba(46, 91, 255, 0.4) !important;
-        }
-        
-        /* Expander styling */
-        .streamlit-expanderHeader {
-            background: rgba(46, 91, 255, 0.05) !important;
-            border-radius: 10px !important;
-            padding: 1rem !important;
-        }
-        
-        /* Info/Warning/Success boxes */
-        .stAlert {
-            border-radius: 12px !important;
-            padding: 1rem !important;
-        }
-        
-        /* Welcome card styling */
-        .welcome-card {
-            background: rgba(46, 91, 255, 0.08);
-            border: 2px solid rgba(46, 91, 255, 0.2);
-            border-radius: 15px;
-            padding: 2rem;
-            margin: 1rem 0;
-            animation: fadeIn 0.6s ease-in;
-        }
-        
-        .welcome-card h2 {
-            color: #2E5BFF;
-            margin-top: 0;
-            font-size: 1.8rem;
-        }
-        
-        .welcome-card h3 {
-            color: #2E5BFF;
-            margin-top: 1.5rem;
-            font-size: 1.3rem;
-        }
-        
-        .welcome-card p {
-            color: #FAFAFA;
-            line-height: 1.6;
-        }
-        
-        .welcome-card ol {
-            color: #FAFAFA;
-        }
-        
-        .welcome-card li {
-            margin: 0.8rem 0;
-            color: #FAFAFA;
-        }
-        
-        /* Stats grid */
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(3, 1fr);
-            gap: 1rem;
-            margin: 1.5rem 0;
-        }
-        
-        .stat-item {
-            padding: 1.5rem;
-            background: rgba(46, 91, 255, 0.15);
-            border-radius: 12px;
-            text-align: center;
-            border: 1px solid rgba(46, 91, 255, 0.2);
-            transition: all 0.3s ease;
-        }
-        
-        .stat-item:hover {
-            background: rgba(46, 91, 255, 0.25);
-            transform: translateY(-3px);
-        }
-        
-        .stat-item div:first-child {
-            font-size: 2rem;
-            margin-bottom: 0.5rem;
-        }
-        
-        .stat-number {
-            font-size: 2rem;
-            font-weight: 700;
-            color: #2E5BFF;
-            margin: 0.5rem 0;
-        }
-        
-        .stat-label {
-            font-size: 0.9rem;
-            color: #FAFAFA;
-            opacity: 0.85;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    """Inject professional custom CSS for enhanced UI (static/skillbridge.css, read once)."""
+    st.markdown(_load_css(), unsafe_allow_html=True)
 
 inject_custom_css()
 
 # ---------------------------
 # Helper Functions for UI
 # ---------------------------
-def display_score_visual(score_name: str, score_value: float, max_score: float = 100.0) -> None:
-    """Display score as a visual progress bar with color coding."""
+# Score tiers: below 50, 50-74, 75 and up. Every table below is indexed by _tier.
+def _tier(score: float, table: tuple) -> Any:
+    return table[(score >= 50) + (score >= 75)]
+
+# (badge class, emoji) per tier, for the score bars (tier of the percentage)
+_BADGE_TIERS = (("score-needs-work", "💪"), ("score-good", "👍"), ("score-excellent", "🌟"))
+_SCORE_HTML = (
+    '<div class="performance-metric">'
+    '<div class="metric-row">'
+    '<span class="metric-label">{emoji} {name}</span>'
+    '<span class="score-badge {cls}">{value:.0f}/{max_score:.0f}</span>'
+    '</div>'
+    '<div class="skill-progress"><div class="skill-progress-fill" style="width: {pct}%;"></div></div>'
+    '</div>'
+)
+
+# (emoji, color) per tier for the overall-score card
+_OVERALL_TIERS = (("💪", "#FF9F1C"), ("👍", "#2E5BFF"), ("🌟", "#00D084"))
+# Session Report emoji per tier
+_SCORE_EMOJI = ("📝", "👍", "🌟")   # full-history entries
+_LATEST_EMOJI = ("💪", "👍", "🌟")  # latest-score metric
+_OVERALL_HTML = (
+    '<div style="text-align: center; padding: 1.5rem; background: linear-gradient(135deg, {color}20 0%, {color}10 100%); '
+    'border-radius: 12px; border: 2px solid {color}40; margin-bottom: 1.5rem; margin-top: 1rem;">'
+    '<div style="font-size: 2.2rem; margin-bottom: 0.5rem;">{emoji}</div>'
+    '<div style="font-size: 2.8rem; font-weight: 700; color: {color}; line-height: 1;">{total:.1f}<span style="font-size: 1.5rem; opacity: 0.7;">/100</span></div>'
+    '<div style="font-size: 0.95rem; opacity: 0.75; margin-top: 0.8rem; color: #FAFAFA;">Overall Score</div>'
+    '</div>'
+)
+# Opening phrases of the template-only coaching / ideal answer (heuristic detection)
+_TEMPLATE_COACHING_PREFIXES = ("Your answer", "You provided", "You covered", "Rewrite your answer", "Next time when facing")
+_TEMPLATE_IDEAL_PREFIX = "**Ideal STAR Answer Example:**"
+_FEEDBACK_CARD_HTML = '<div class="feedback-card{cls}">\n{body}\n</div>'
+# one-slot card bodies
+_IMPROVEMENT_BODY = "<strong>⚡ Key Improvement Area:</strong><br>%s"
+_PRACTICE_BODY = "<strong>📝 Practice Prompt:</strong><br>%s"
+
+def template_flags(fb: Dict[str, Any]) -> Tuple[bool, bool]:
+    """(coaching, ideal answer) template-fallback flags, computed once and memoized on `fb` itself."""
+    if "is_template_coaching" not in fb:
+        # feedback recorded before the flags existed (e.g. a session kept across a code reload)
+        fb["is_template_coaching"] = (fb.get("personalized_coaching") or "").startswith(_TEMPLATE_COACHING_PREFIXES)
+        fb["is_template_ideal"] = (fb.get("ideal_answer") or "").startswith(_TEMPLATE_IDEAL_PREFIX)
+    return fb["is_template_coaching"], fb["is_template_ideal"]
+
+def score_visual_html(score_name: str, score_value: float, max_score: float = 100.0) -> str:
+    """HTML for one score as a visual progress bar with color coding."""
     percentage = min((score_value / max_score) * 100, 100)
-    
-    # Determine badge style based on score
-    if percentage >= 75:
-        badge_class = "score-excellent"
-        emoji = "🌟"
-    elif percentage >= 50:
-        badge_class = "score-good"
-        emoji = "👍"
-    else:
-        badge_class = "score-needs-work"
-        emoji = "💪"
-    
-    st.markdown(f"""
-    <div class="performance-metric">
-        <div class="metric-row">
-            <span class="metric-label">{emoji} {score_name}</span>
-            <span class="score-badge {badge_class}">{score_value:.0f}/{max_score:.0f}</span>
+    cls, emoji = _tier(percentage, _BADGE_TIERS)
+    return _SCORE_HTML.format(emoji=emoji, name=score_name, cls=cls, value=score_value, max_score=max_score, pct=percentage)
+
+
+# Static page HTML, emitted on every rerun (Streamlit redraws from scratch)
+_HEADER_HTML = """
+<div class="main-header">
+    <h1>🎯 SkillsBridge</h1>
+    <div class="tagline">AI-Powered Interview Coaching</div>
+    <div class="subtext">💼 Practice • 📊 Analyze • 🚀 Succeed</div>
+</div>
+"""
+
+_FOOTER_HTML = """
+<div style="text-align: center; padding: 1rem; color: #FAFAFA; opacity: 0.8;">
+    <strong>🎯 SkillsBridge</strong><br>
+    <small>AI-Powered Interview Coach</small><br>
+    <small style="font-size: 0.8rem; opacity: 0.7;">Team 12 • CS(AI&DS)</small>
+</div>
+"""
+
+_REPORT_HEADER_HTML = (
+    "---\n\n"
+    '<div style="height: 0.8rem;"></div>'
+    '<div class="main-header" style="background: linear-gradient(135deg, #2E5BFF 0%, #8B5CF6 100%); padding: 1.2rem; margin: 0;"><h3 style="margin: 0; font-size: 1.2rem;">📊 Session Report</h3></div>'
+    '<div style="height: 0.5rem;"></div>'
+)
+
+_WELCOME_HTML = """
+<div class="welcome-card">
+    <h2>👋 Welcome to SkillsBridge!</h2>
+    <p>Your AI-powered interview coach is ready to help you master behavioral and technical interviews with personalized feedback.</p>
+    <h3>🚀 How It Works:</h3>
+    <ol>
+        <li><strong>Answer Questions:</strong> Practice with 150+ carefully curated interview questions</li>
+        <li><strong>Get AI Feedback:</strong> Receive instant personalized coaching powered by Gemini AI</li>
+        <li><strong>Learn STAR Method:</strong> See ideal answer examples based on your context</li>
+        <li><strong>Track Progress:</strong> Monitor your improvement over multiple practice sessions</li>
+    </ol>
+</div>
+<div class="welcome-card" style="text-align: center; margin-top: 2rem;">
+    <h3>📊 Platform Stats</h3>
+    <div class="stats-grid">
+        <div class="stat-item">
+            <div>❓</div>
+            <div class="stat-number">150</div>
+            <div class="stat-label">Questions</div>
+        </div>
+        <div class="stat-item">
+            <div>🤖</div>
+            <div class="stat-number">3</div>
+            <div class="stat-label">AI Agents</div>
         </div>
-        <div class="skill-progress">
-            <div class="skill-progress-fill" style="width: {percentage}%;"></div>
+        <div class="stat-item">
+            <div>⚡</div>
+            <div class="stat-number">∞</div>
+            <div class="stat-label">Attempts</div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
-
+</div>
+<div style="margin-top: 2rem; padding: 1.5rem; background: rgba(46, 91, 255, 0.15); border-radius: 8px; border-left: 4px solid #2E5BFF;">
+    <strong style="color: #2E5BFF; font-size: 1.05rem;">💡 Pro Tip:</strong> 
+    <span style="color: #FAFAFA; margin-left: 0.5rem;">Start with easy questions to warm up, then progress to harder scenarios. The system intelligently adapts to your performance!</span>
+</div>
+"""
 
 def display_welcome_screen() -> None:
     """Display professional welcome screen for new sessions."""
-    html_content = """
-    <div class="welcome-card">
-        <h2>👋 Welcome to SkillsBridge!</h2>
-        <p>Your AI-powered interview coach is ready to help you master behavioral and technical interviews with personalized feedback.</p>
-        <h3>🚀 How It Works:</h3>
-        <ol>
-            <li><strong>Answer Questions:</strong> Practice with 150+ carefully curated interview questions</li>
-            <li><strong>Get AI Feedback:</strong> Receive instant personalized coaching powered by Gemini AI</li>
-            <li><strong>Learn STAR Method:</strong> See ideal answer examples based on your context</li>
-            <li><strong>Track Progress:</strong> Monitor your improvement over multiple practice sessions</li>
-        </ol>
-    </div>
-    <div class="welcome-card" style="text-align: center; margin-top: 2rem;">
-        <h3>📊 Platform Stats</h3>
-        <div class="stats-grid">
-            <div class="stat-item">
-                <div>❓</div>
-                <div class="stat-number">150</div>
-                <div class="stat-label">Questions</div>
-            </div>
-            <div class="stat-item">
-                <div>🤖</div>
-                <div class="stat-number">3</div>
-                <div class="stat-label">AI Agents</div>
-            </div>
-            <div class="stat-item">
-                <div>⚡</div>
-                <div class="stat-number">∞</div>
-                <div class="stat-label">Attempts</div>
-            </div>
-        </div>
-    </div>
-    <div style="margin-top: 2rem; padding: 1.5rem; background: rgba(46, 91, 255, 0.15); border-radius: 8px; border-left: 4px solid #2E5BFF;">
-        <strong style="color: #2E5BFF; font-size: 1.05rem;">💡 Pro Tip:</strong> 
-        <span style="color: #FAFAFA; margin-left: 0.5rem;">Start with easy questions to warm up, then progress to harder scenarios. The system intelligently adapts to your performance!</span>
-    </div>
-    """
-    st.markdown(html_content, unsafe_allow_html=True)
-
-# ---------------------------
-# Setup paths & ensure folders
-# ---------------------------
-ROOT = os.path.dirname(os.path.abspath(__file__))
-LOGS_DIR = os.path.join(ROOT, "logs")
-DEMO_DIR = os.path.join(ROOT, "demo_cases")
-
-os.makedirs(LOGS_DIR, exist_ok=True)
-os.makedirs(DEMO_DIR, exist_ok=True)
-
-SESSION_LOG_FILE = os.path.join(LOGS_DIR, "session_logs.json")
+    st.markdown(_WELCOME_HTML, unsafe_allow_html=True)
 
 # ---------------------------
 # Utilities
 # ---------------------------
-def load_session_logs() -> List[Dict[str, Any]]:
-    if not os.path.exists(SESSION_LOG_FILE):
-        return []
+def _migrate_legacy_session_logs() -> None:
+    """One-shot rewrite of the old JSON-array log as JSON Lines (old file kept as .bak)."""
+    if os.path.exists(SESSION_LOG_FILE) or not os.path.exists(LEGACY_SESSION_LOG_FILE):
+        return
     try:
-        with open(SESSION_LOG_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return []
+        with open(LEGACY_SESSION_LOG_FILE, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        tmp = SESSION_LOG_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, separators=(",", ":"), ensure_ascii=False))
+                f.write("\n")
+        os.replace(tmp, SESSION_LOG_FILE)
+        os.replace(LEGACY_SESSION_LOG_FILE, LEGACY_SESSION_LOG_FILE + ".bak")
+    except Exception as e:
+        logger.error("Unable to migrate %s: %s", LEGACY_SESSION_LOG_FILE, e, exc_info=True)
+
+def _write_session_log(entry: Dict[str, Any]) -> None:
+    # underscore keys are UI-only caches (e.g. "_rendered_md"), not log data
+    entry = {k: v for k, v in entry.items() if not k.startswith("_")}
+    with open(SESSION_LOG_FILE, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, separators=(",", ":"), ensure_ascii=False) + "\n")
+
+def _log_writer(log_q: "queue.Queue[Optional[Dict[str, Any]]]") -> None:
+    while True:
+        entry = log_q.get()
+        try:
+            if entry is None:
+                return
+            _write_session_log(entry)
+        except Exception as e:
+            logger.error("Unable to write session log: %s", e, exc_info=True)
+        finally:
+            log_q.task_done()
+
+@st.cache_resource
+def _session_log_queue() -> "queue.Queue[Optional[Dict[str, Any]]]":
+    # One writer thread per process (cache_resource survives reruns), the only
+    # thing that touches the log file; the atexit hook flushes whatever is still
+    # queued before the process exits.
+    _migrate_legacy_session_logs()
+    log_q: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+    writer = threading.Thread(target=_log_writer, args=(log_q,), name="session-log-writer", daemon=True)
+    writer.start()
+
+    def _drain() -> None:
+        log_q.put(None)
+        writer.join(timeout=5)
+
+    atexit.register(_drain)
+    return log_q
 
 def append_session_log(entry: Dict[str, Any]):
-    logs = load_session_logs()
-    logs.append(entry)
-    with open(SESSION_LOG_FILE, "w", encoding="utf-8") as f:
-        json.dump(logs, f, indent=2)
+    """Queue `entry` for the background writer; returns without touching disk."""
+    _session_log_queue().put(entry)
+
+@st.cache_resource
+def get_interviewer() -> Interviewer:
+    # Agents hold only read-only data (question bank, rubric, templates, LLM
+    # client); per-user state lives in st.session_state, so one instance per
+    # process is shared by every session.
+    return Interviewer()
+
+@st.cache_resource
+def get_evaluator() -> Evaluator:
+    return Evaluator()
+
+@st.cache_resource
+def get_coach() -> Coach:
+    return Coach()
+
+def render_turn_md(turn: Dict[str, Any]) -> str:
+    """Chat-history markdown for one turn; built once when the turn is recorded."""
+    ev = turn["eval"]
+    s_val = ev.get("star_structure")
+    if s_val is None:  # older evaluators only report "structure"
+        s_val = ev.get("structure")
+    # blank lines keep each piece its own block, as separate st.markdown calls did
+    return (
+        f"**Q — {turn['question_id']}**: {turn['question_text']}\n\n"
+        f"> **Your answer:** {turn['answer']}\n\n"
+        f"> **Score:** {ev['total']} (C:{ev['clarity']}, S:{s_val}, R:{ev['relevance']})\n\n"
+        "---\n\n"
+    )
+
+@st.cache_resource
+def _background_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="skillbridge-bg")
+
+@st.cache_resource(show_spinner=False)
+def _preload_agents() -> None:
+    """Warm agent_core's process-wide caches off the script thread at startup.
+
+    Plain constructors, not the get_* factories: cache_resource needs a
+    ScriptRunContext, so the shared instances are still built on the script
+    thread at Start Session. What carries over is the parsed question bank and
+    rubric (agent_core caches them per file) and the LLMClient singleton.
+    """
+    pool = _background_executor()
+    for ctor in (Interviewer, Evaluator):
+        # throwaway instances; a failure here resurfaces at Start Session
+        pool.submit(ctor)
+
+def _sess() -> Dict[str, Any]:
+    """Per-session state; widget keys stay at the top level of st.session_state."""
+    return st.session_state.setdefault("sess", {})
+
+# session keys pick_question reads or updates
+_PICK_STATE_KEYS = ("last_overall_score", "_free", "_free_owner", "_free_seen")
+
+def prefetch_next_question(interviewer: Interviewer) -> None:
+    """Pick the next question in the background while the user reads their feedback."""
+    sess = _sess()
+    snapshot = {k: sess[k] for k in _PICK_STATE_KEYS if k in sess}
+    # pick_question pops from these deques: give the worker its own copies so the
+    # session's stay untouched until take_prefetched_question copies the result back
+    if isinstance(snapshot.get("_free"), dict):
+        snapshot["_free"] = {d: deque(q) for d, q in snapshot["_free"].items()}
+    snapshot["history"] = list(sess.get("history", []))
+    future = _background_executor().submit(interviewer.pick_question, snapshot)
+    sess["next_q_future"] = (future, snapshot)
+
+def take_prefetched_question() -> Optional[Dict[str, Any]]:
+    """Prefetched question (and the picker state it advanced), or None to pick inline."""
+    sess = _sess()
+    pending = sess.pop("next_q_future", None)
+    if pending is None:
+        return None
+    future, snapshot = pending
+    try:
+        q = future.result(timeout=5)
+    except Exception as e:
+        logger.error("Question prefetch failed: %s", e, exc_info=True)
+        return None
+    for k in _PICK_STATE_KEYS[1:]:
+        if k in snapshot:
+            sess[k] = snapshot[k]
+    return q
+
+def _update_report_cache(turn: Dict[str, Any]) -> None:
+    """Fold a newly recorded turn into the Session Report's running totals."""
+    sess = _sess()
+    total = turn["eval"]["total"]
+    stats = sess.get("report_stats")
+    if stats is None:
+        stats = sess["report_stats"] = {"sum": 0.0, "count": 0, "excellent": 0, "first": total, "latest": total}
+    stats["sum"] += total
+    stats["count"] += 1
+    stats["excellent"] += total >= 75
+    stats["latest"] = total
+
+def _rebuild_report_stats(history: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Session Report totals recomputed from scratch, in one pass over `history`."""
+    total_sum = 0.0
+    excellent = 0
+    first = last = None
+    for t in history:
+        score = t["eval"]["total"]
+        total_sum += score
+        excellent += score >= 75
+        if first is None:
+            first = score
+        last = score
+    return {"sum": total_sum, "count": len(history), "excellent": excellent, "first": first, "latest": last}
+
+def finalize_turn(q: Dict[str, Any], answer: str, eval_result: Dict[str, Any]) -> None:
+    """Coach the scored answer, record the turn (history + log) and clear the question state."""
+    sess = _sess()
+    coach: Coach = sess["coach"]
+    # Resolve the coach's signature once per session instead of probing with TypeError
+    new_sig = sess.get("coach_new_sig")
+    if new_sig is None:
+        new_sig = sess["coach_new_sig"] = len(inspect.signature(coach.generate_feedback).parameters) >= 4
+    if new_sig:
+        # New signature: (question_text, user_answer, evaluation_result, model_answer)
+        feedback = coach.generate_feedback(q.get("text") if isinstance(q, dict) else q,
+                                           answer,
+                                           eval_result,
+                                           q.get("model_answer", "") if isinstance(q, dict) else "")
+    else:
+        # Old signature: (q, answer, eval)
+        feedback = coach.generate_feedback(q, answer, eval_result)
+    # template-fallback flags never change for a given feedback, so set them here
+    # rather than re-checking prefixes on every rerun
+    template_flags(feedback)
+    sess["last_eval"] = eval_result
+    sess["last_feedback"] = feedback
+
+    # Build turn and append to history & logs
+    turn = {
+        "timestamp": time.time_ns() // 1_000_000_000,
+        "user": sess["user_name"],
+        "question_id": q["id"],
+        "question_text": q["text"],
+        "answer": answer,
+        "eval": eval_result,
+        "coach": feedback
+    }
+    turn["_rendered_md"] = render_turn_md(turn)
+    turn["_answer_len"] = len(answer)
+    sess["history"].append(turn)
+    _update_report_cache(turn)
+    append_session_log(turn)
+    # Update last overall score for adaptive difficulty
+    sess["last_overall_score"] = eval_result.get("total", 0)
+    prefetch_next_question(sess["interviewer"])
+
+    # Clear current question to allow next
+    sess["current_question"] = None
+    sess["current_question_id"] = None
+    sess["input_answer"] = ""
+    sess["waiting_for_clarification"] = False
+    sess["clarification_prompt"] = ""
+    _safe_rerun()
 
 def reset_app_state():
-    # Resets Streamlit session_state keys we use
-    keys = [
-        "session_active", "user_name", "interviewer", "evaluator", "coach",
-        "current_question", "current_question_id", "input_answer",
-        "waiting_for_clarification", "clarification_prompt", "last_eval",
-        "last_feedback", "history", "last_overall_score"
-    ]
-    for k in keys:
-        if k in st.session_state:
-            del st.session_state[k]
+    # Drops every per-session key at once (see _sess)
+    st.session_state.pop("sess", None)
+
+_METRICS_HTML = (
+    '<div class="metrics-grid">'
+    '<div class="stat-item"><div>📈</div><div class="stat-number">{avg:.1f}/100</div>'
+    '<div class="stat-label">Average Score</div><div class="metric-delta{delta_cls}">{delta}</div></div>'
+    '<div class="stat-item"><div>❓</div><div class="stat-number">{attempted}</div>'
+    '<div class="stat-label">Questions Attempted</div></div>'
+    '<div class="stat-item"><div>⭐</div><div class="stat-number">{excellent}</div>'
+    '<div class="stat-label">Excellent Answers</div></div>'
+    '<div class="stat-item"><div>{latest_emoji}</div><div class="stat-number">{latest:.1f}/100</div>'
+    '<div class="stat-label">Latest Score</div></div>'
+    '</div>'
+)
+
+def _full_history_md(hist: List[Dict[str, Any]]) -> str:
+    """Full-history card as one markdown string; blank lines let the markdown render inside the card."""
+    lines = []
+    for idx, t in enumerate(hist, 1):
+        score = t["eval"]["total"]
+        lines.append(
+            f"**{idx}. {t['question_id']}** {_tier(score, _SCORE_EMOJI)}\n"
+            f"- Score: {score:.1f}/100\n"
+            f"- Answer length: {t.get('_answer_len') or len(t['answer'])} chars"
+        )
+    return "<div class='feedback-card'>\n\n" + "\n\n".join(lines) + "\n\n</div>"
+
+@_FRAGMENT
+def render_session_report() -> None:
+    """Session Report metrics and history; toggling its checkbox reruns only this block."""
+    sess = _sess()
+    hist = sess.get("history", [])
+    if not hist:
+        st.info("📈 No questions answered yet. Start practicing to see your performance!")
+    else:
+        # Metrics are kept up to date by finalize_turn, so no pass over hist here
+        stats = sess.get("report_stats")
+        if stats is None or stats["count"] != len(hist):
+            # e.g. a session carried over a code reload from before the stats existed
+            stats = sess["report_stats"] = _rebuild_report_stats(hist)
+        avg = stats["sum"] / stats["count"]
+        excellent_count = stats["excellent"]
+        improvement = stats["latest"] - stats["first"] if stats["count"] > 1 else 0
+
+        # All four metrics as one HTML grid
+        latest_score = stats["latest"]
+        st.markdown(
+            _METRICS_HTML.format(
+                avg=avg,
+                delta_cls=" up" if improvement > 0 else "",
+                delta=f"+{improvement:.1f}" if improvement > 0 else f"{improvement:.1f}",
+                attempted=len(hist),
+                excellent=excellent_count,
+                latest_emoji=_tier(latest_score, _LATEST_EMOJI),
+                latest=latest_score,
+            ),
+            unsafe_allow_html=True,
+        )
+
+        # Show detailed history
+        if st.checkbox("📋 Show Full History", key="show_full_turns", value=False):
+            # history only grows by appending, so the last turn identifies its contents
+            key = (len(hist), hist[-1]["question_id"], hist[-1]["eval"]["total"])
+            cached = sess.get("_report_cache")
+            if cached is None or cached[0] != key:
+                cached = sess["_report_cache"] = (key, _full_history_md(hist))
+            st.markdown(cached[1], unsafe_allow_html=True)
 
 # ---------------------------
 # Initialize UI / Session
 # ---------------------------
 
+_preload_agents()
+
 # Professional header with branding
-st.markdown("""
-<div class="main-header">
-    <h1>🎯 SkillsBridge</h1>
-    <div class="tagline">AI-Powered Interview Coaching</div>
-    <div class="subtext">💼 Practice • 📊 Analyze • 🚀 Succeed</div>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
 # Sidebar controls
 with st.sidebar:
     st.header("Session Controls")
-    if "session_active" not in st.session_state:
-        st.session_state.session_active = False
+    sess = _sess()
+    sess.setdefault("session_active", False)
 
-    if not st.session_state.session_active:
-        st.session_state.user_name = st.text_input("Your name (for session):", value="", key="user_name_input")
+    if not sess["session_active"]:
+        sess["user_name"] = st.text_input("Your name (for session):", value="", key="user_name_input")
         start_btn = st.button("Start Session", key="start_btn")
         if start_btn:
-            if not st.session_state.user_name.strip():
+            if not sess["user_name"].strip():
                 st.warning("Please enter a name to start.")
             else:
                 # Initialize agents and session_state
-                st.session_state.interviewer = Interviewer()
-                st.session_state.evaluator = Evaluator()
-                st.session_state.coach = Coach()
-                st.session_state.current_question = None
-                st.session_state.current_question_id = None
-                st.session_state.input_answer = ""
-                st.session_state.waiting_for_clarification = False
-                st.session_state.clarification_prompt = ""
-                st.session_state.last_eval = None
-                st.session_state.last_feedback = None
-                st.session_state.history = []
-                st.session_state.session_active = True
+                sess["interviewer"] = get_interviewer()
+                sess["evaluator"] = get_evaluator()
+                sess["coach"] = get_coach()
+                sess["current_question"] = None
+                sess["current_question_id"] = None
+                sess["input_answer"] = ""
+                sess["waiting_for_clarification"] = False
+                sess["clarification_prompt"] = ""
+                sess["last_eval"] = None
+                sess["last_feedback"] = None
+                sess["history"] = []
+                sess.pop("report_stats", None)
+                sess["session_active"] = True
                 _safe_rerun()
     else:
-        st.write(f"**Active session:** {st.session_state.get('user_name', '')}")
+        st.write(f"**Active session:** {sess.get('user_name', '')}")
         if st.button("Reset Session", key="reset_btn"):
             reset_app_state()
             _safe_rerun()
@@ -567,98 +575,68 @@ col1, col2 = st.columns([1.8, 1.2], gap="large")
 # Main column: Chat UI & Flow
 # ---------------------------
 with col1:
+    # Snapshot reads once; keys the form handlers below mutate are re-read live.
+    sess = _sess()
+    active = sess.get("session_active")
+    history = sess.get("history", [])
+    current_q = sess.get("current_question")
+
     st.subheader("Interview Chat")
-    if not st.session_state.get("session_active"):
+    if not active:
         display_welcome_screen()
     else:
         # Show last few turns in chat-like format
-        history = st.session_state.get("history", [])
         if history:
-            for turn in history[-6:]:
-                st.markdown(f"**Q — {turn['question_id']}**: {turn['question_text']}")
-                st.markdown(f"> **Your answer:** {turn['answer']}")
-                s_val = turn['eval'].get('star_structure', turn['eval'].get('structure'))
-                st.markdown(f"> **Score:** {turn['eval']['total']} (C:{turn['eval']['clarity']}, S:{s_val}, R:{turn['eval']['relevance']})")
-                st.markdown("---")
+            st.markdown("".join(t.get("_rendered_md") or render_turn_md(t) for t in history[-6:]))
 
         # Button to fetch next question if none active
-        if st.session_state.get("current_question") is None:
+        if current_q is None:
             if st.button("Get Next Question", key="get_q_btn"):
-                interviewer: Interviewer = st.session_state["interviewer"]
-                q = interviewer.pick_question(st.session_state)
-                st.session_state.current_question = q
-                st.session_state.current_question_id = q["id"]
-                st.session_state.input_answer = ""
+                interviewer: Interviewer = sess["interviewer"]
+                q = take_prefetched_question()
+                if q is None:
+                    q = interviewer.pick_question(sess)
+                sess["current_question"] = q
+                sess["current_question_id"] = q["id"]
+                sess["input_answer"] = ""
                 _safe_rerun()
             else:
                 st.info("Click 'Get Next Question' to begin this turn.")
         else:
-            q = st.session_state.current_question
+            q = current_q
             st.markdown(f"### Question ({q['id']}) — {q.get('difficulty', '')}")
             st.write(q["text"])
             with st.form(key="answer_form", clear_on_submit=False):
-                ans = st.text_area("Your answer (type and submit):", value=st.session_state.get("input_answer", ""), height=160, key="answer_box")
+                ans = st.text_area("Your answer (type and submit):", value=sess.get("input_answer", ""), height=160, key="answer_box")
                 submitted = st.form_submit_button("Submit Answer")
                 if submitted:
-                    st.session_state.input_answer = ans.strip()
-                    if not st.session_state.input_answer:
+                    sess["input_answer"] = ans.strip()
+                    if not sess["input_answer"]:
                         st.warning("Please type an answer before submitting.")
                     else:
-                        # Evaluate
-                        evaluator: Evaluator = st.session_state["evaluator"]
-                        eval_result = evaluator.score(q["text"], st.session_state.input_answer)
-                        st.session_state.last_eval = eval_result
-                        st.session_state.last_feedback = None
+                        # Evaluate (heuristic, no API call; the coach's cache lookup waits
+                        # until we know the answer needs Gemini at all)
+                        evaluator: Evaluator = sess["evaluator"]
+                        eval_result = evaluator.score(q["text"], sess["input_answer"])
+                        sess["last_eval"] = eval_result
+                        sess["last_feedback"] = None
 
                         # If clarification needed -> set flag and show prompt
                         if eval_result.get("clarification_needed"):
-                            interviewer: Interviewer = st.session_state["interviewer"]
-                            clar = interviewer.ask_clarification(q, st.session_state)
-                            st.session_state.waiting_for_clarification = True
-                            st.session_state.clarification_prompt = clar
+                            interviewer: Interviewer = sess["interviewer"]
+                            clar = interviewer.ask_clarification(q, sess)
+                            sess["waiting_for_clarification"] = True
+                            sess["clarification_prompt"] = clar
                             # Save minimal turn while waiting? We'll save after final feedback.
                             _safe_rerun()
                         else:
                             # Generate coach feedback and finalize turn
-                            coach: Coach = st.session_state["coach"]
-                            # Prefer new signature: (question_text, user_answer, evaluation_result, model_answer)
-                            try:
-                                feedback = coach.generate_feedback(q.get("text") if isinstance(q, dict) else q,
-                                                                   st.session_state.input_answer,
-                                                                   eval_result,
-                                                                   q.get("model_answer", "") if isinstance(q, dict) else "")
-                            except TypeError:
-                                # Fallback to old signature if coach expects (q, answer, eval)
-                                feedback = coach.generate_feedback(q, st.session_state.input_answer, eval_result)
-                            st.session_state.last_feedback = feedback
-
-                            # Build turn and append to history & logs
-                            turn = {
-                                "timestamp": int(time.time()),
-                                "user": st.session_state["user_name"],
-                                "question_id": q["id"],
-                                "question_text": q["text"],
-                                "answer": st.session_state["input_answer"],
-                                "eval": eval_result,
-                                "coach": feedback
-                            }
-                            st.session_state.history.append(turn)
-                            append_session_log(turn)
-                            # Update last overall score for adaptive difficulty
-                            st.session_state["last_overall_score"] = eval_result.get("total", 0)
-
-                            # Clear current question to allow next
-                            st.session_state.current_question = None
-                            st.session_state.current_question_id = None
-                            st.session_state.input_answer = ""
-                            st.session_state.waiting_for_clarification = False
-                            st.session_state.clarification_prompt = ""
-                            _safe_rerun()
+                            finalize_turn(q, sess["input_answer"], eval_result)
 
             # Clarification flow UI
-            if st.session_state.get("waiting_for_clarification"):
+            if sess.get("waiting_for_clarification"):
                 st.warning("Evaluator requests clarification:")
-                st.info(st.session_state.get("clarification_prompt"))
+                st.info(sess.get("clarification_prompt"))
                 with st.form(key="clarify_form", clear_on_submit=False):
                     clar_ans = st.text_area("Add your clarification (append to your previous answer):", value="", height=120, key="clar_box")
                     clar_sub = st.form_submit_button("Submit Clarification")
@@ -667,93 +645,51 @@ with col1:
                             st.warning("Please provide a clarification or additional detail.")
                         else:
                             # Append clarification and re-evaluate
-                            q = st.session_state.current_question
-                            combined = (st.session_state.get("input_answer", "") + " " + clar_ans.strip()).strip()
-                            evaluator: Evaluator = st.session_state["evaluator"]
+                            q = sess["current_question"]
+                            combined = (sess.get("input_answer", "") + " " + clar_ans.strip()).strip()
+                            evaluator: Evaluator = sess["evaluator"]
                             eval_result = evaluator.score(q["text"], combined)
-                            st.session_state.last_eval = eval_result
-
-                            # Generate coach feedback
-                            coach: Coach = st.session_state["coach"]
-                            # Prefer new signature but fallback if needed
-                            try:
-                                feedback = coach.generate_feedback(q.get("text") if isinstance(q, dict) else q,
-                                                                   combined,
-                                                                   eval_result,
-                                                                   q.get("model_answer", "") if isinstance(q, dict) else "")
-                            except TypeError:
-                                feedback = coach.generate_feedback(q, combined, eval_result)
-                            st.session_state.last_feedback = feedback
-
-                            # Build turn and append to history & logs
-                            turn = {
-                                "timestamp": int(time.time()),
-                                "user": st.session_state["user_name"],
-                                "question_id": q["id"],
-                                "question_text": q["text"],
-                                "answer": combined,
-                                "eval": eval_result,
-                                "coach": feedback
-                            }
-                            st.session_state.history.append(turn)
-                            append_session_log(turn)
-                            # Update last overall score for adaptive difficulty
-                            st.session_state["last_overall_score"] = eval_result.get("total", 0)
-
-                            # Reset question state
-                            st.session_state.current_question = None
-                            st.session_state.current_question_id = None
-                            st.session_state.input_answer = ""
-                            st.session_state.waiting_for_clarification = False
-                            st.session_state.clarification_prompt = ""
-                            _safe_rerun()
+                            finalize_turn(q, combined, eval_result)
 
 # ---------------------------
 # Right column: Feedback & Reports
 # ---------------------------
 with col2:
+    # col1's handlers have already run, so these are final for this rerun
+    sess = _sess()
+    eval_result = sess.get("last_eval")
+    fb = sess.get("last_feedback")
+
     st.subheader("📊 Instant Feedback")
     
     # Add spacing
     st.markdown('<div style="height: 0.5rem;"></div>', unsafe_allow_html=True)
     
-    if st.session_state.get("last_eval") is None:
+    if eval_result is None:
         st.info("💡 Submit an answer to see your personalized feedback and coaching.")
     else:
-        eval_result = st.session_state["last_eval"]
-        
         # Total score with emoji indicator
         total_score = eval_result.get("total", 0)
-        if total_score >= 75:
-            emoji = "🌟"
-            color = "#00D084"
-        elif total_score >= 50:
-            emoji = "👍"
-            color = "#2E5BFF"
-        else:
-            emoji = "💪"
-            color = "#FF9F1C"
-        
-        st.markdown(f"""
-        <div style="text-align: center; padding: 1.5rem; background: linear-gradient(135deg, {color}20 0%, {color}10 100%); 
-                    border-radius: 12px; border: 2px solid {color}40; margin-bottom: 1.5rem; margin-top: 1rem;">
-            <div style="font-size: 2.2rem; margin-bottom: 0.5rem;">{emoji}</div>
-            <div style="font-size: 2.8rem; font-weight: 700; color: {color}; line-height: 1;">{total_score:.1f}<span style="font-size: 1.5rem; opacity: 0.7;">/100</span></div>
-            <div style="font-size: 0.95rem; opacity: 0.75; margin-top: 0.8rem; color: #FAFAFA;">Overall Score</div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Visual breakdown of scores
-        st.markdown("**📈 Performance Breakdown**")
-        st.markdown('<div style="height: 0.3rem;"></div>', unsafe_allow_html=True)
+        emoji, color = _tier(total_score, _OVERALL_TIERS)
         
         clarity_val = eval_result.get('clarity')
-        star_val = eval_result.get('star_structure', eval_result.get('structure'))
+        star_val = eval_result.get('star_structure')
+        if star_val is None:
+            star_val = eval_result.get('structure')
         relevance_val = eval_result.get('relevance')
         
-        display_score_visual("Clarity", clarity_val)
-        display_score_visual("STAR Structure", star_val)
-        display_score_visual("Relevance", relevance_val)
+        # Score card, breakdown header and bars go out as one element
+        st.markdown(
+            "\n\n".join([
+                _OVERALL_HTML.format(color=color, emoji=emoji, total=total_score),
+                "**📈 Performance Breakdown**",
+                '<div style="height: 0.3rem;"></div>'
+                + score_visual_html("Clarity", clarity_val)
+                + score_visual_html("STAR Structure", star_val)
+                + score_visual_html("Relevance", relevance_val),
+            ]),
+            unsafe_allow_html=True,
+        )
         
         # Diagnostics
         if eval_result.get("diagnostics"):
@@ -761,137 +697,77 @@ with col2:
                 for k, v in eval_result.get("diagnostics", {}).items():
                     st.markdown(f"**{k.replace('_', ' ').title()}:** {v}")
 
-    if st.session_state.get("last_feedback"):
-        st.markdown("---")
-        st.markdown('<div style="height: 0.5rem;"></div>', unsafe_allow_html=True)
-        fb = st.session_state["last_feedback"]
-        
-        st.markdown("**🎓 Coaching & Guidance**")
-        
-        # Improvement bullet
-        st.markdown(f"""
-        <div class="feedback-card warning">
-            <strong>⚡ Key Improvement Area:</strong><br>{fb.get("improvement_bullet")}
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Practice prompt
-        st.markdown(f"""
-        <div class="feedback-card">
-            <strong>📝 Practice Prompt:</strong><br>{fb.get("practice_prompt")}
-        </div>
-        """, unsafe_allow_html=True)
+    if fb:
+        # Separator, header, improvement bullet and practice prompt in one element
+        st.markdown(
+            "\n\n".join([
+                "---",
+                '<div style="height: 0.5rem;"></div>',
+                "**🎓 Coaching & Guidance**",
+                _FEEDBACK_CARD_HTML.format(cls=" warning", body=_IMPROVEMENT_BODY % fb.get("improvement_bullet")),
+                _FEEDBACK_CARD_HTML.format(cls="", body=_PRACTICE_BODY % fb.get("practice_prompt")),
+            ]),
+            unsafe_allow_html=True,
+        )
         
         # Model answer in code block
         with st.expander("📚 Model Answer Template", expanded=False):
             st.code(fb.get("model_answer"), language="markdown")
         
+        # Gemini was skipped on purpose for a strong answer; not a fallback
+        skipped_strong = fb.get("source") == "skipped_strong"
+
         # Display personalized coaching if available
-        if fb.get("personalized_coaching"):
-            coaching_text = fb.get("personalized_coaching", "")
-            # List of template-only phrases (heuristic detection)
-            template_phrases = [
-                "Your answer",
-                "You provided",
-                "You covered",
-                "Rewrite your answer",
-                "Next time when facing"
-            ]
-            is_template = any(coaching_text.startswith(phrase) for phrase in template_phrases)
+        coaching_text = fb.get("personalized_coaching")
+        if coaching_text:
+            is_template = template_flags(fb)[0]
             
             st.markdown("**💡 AI-Powered Personalized Coaching**")
-            if is_template:
+            if skipped_strong:
+                st.success("🌟 Strong answer on every axis — no AI call was needed for this feedback.")
+            elif is_template:
                 st.warning("⚠️ Template feedback shown (Gemini response may not have parsed correctly). Check logs for details.")
             else:
                 st.success("✅ AI-Generated feedback from Gemini")
             
-            st.markdown(f"""
-            <div class="feedback-card success">
-                {coaching_text}
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_FEEDBACK_CARD_HTML.format(cls=" success", body=coaching_text), unsafe_allow_html=True)
         
         # Display ideal answer
-        if fb.get("ideal_answer"):
-            st.markdown("**📚 Ideal STAR Answer (AI-Generated)**")
-            st.markdown(f"""
-            <div class="feedback-card">
-                {fb.get("ideal_answer")}
-            </div>
-            """, unsafe_allow_html=True)
+        ideal_text = fb.get("ideal_answer")
+        if ideal_text:
+            st.markdown(
+                "**📚 Ideal STAR Answer (AI-Generated)**\n\n"
+                + _FEEDBACK_CARD_HTML.format(cls="", body=ideal_text),
+                unsafe_allow_html=True,
+            )
         
         # Display ideal answer example
-        if fb.get("ideal_answer"):
+        if ideal_text:
             # Check if this is a template fallback
-            is_template = fb.get("ideal_answer", "").startswith("**Ideal STAR Answer Example:**")
+            is_template = template_flags(fb)[1]
             
             with st.expander("🎯 Ideal Answer Example (Based on Your Context)", expanded=True):
-                if is_template:
+                if skipped_strong:
+                    st.info("ℹ️ Showing the general STAR template for reference — your answer was strong enough that no personalized example was generated.")
+                elif is_template:
                     st.info("ℹ️ Showing template answer (Gemini quota exhausted). Personalized examples resume when quota resets.")
-                st.markdown(f"""
-                <div class="feedback-card success">
-                    {fb.get("ideal_answer")}
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_FEEDBACK_CARD_HTML.format(cls=" success", body=ideal_text), unsafe_allow_html=True)
 
-    st.markdown("---")
-    st.markdown('<div style="height: 0.8rem;"></div>', unsafe_allow_html=True)
-    st.markdown('<div class="main-header" style="background: linear-gradient(135deg, #2E5BFF 0%, #8B5CF6 100%); padding: 1.2rem; margin: 0;"><h3 style="margin: 0; font-size: 1.2rem;">📊 Session Report</h3></div>', unsafe_allow_html=True)
-    st.markdown('<div style="height: 0.5rem;"></div>', unsafe_allow_html=True)
-    
-    hist = st.session_state.get("history", [])
-    if not hist:
+    if eval_result is None and not fb and not sess.get("history"):
+        # nothing scored or recorded yet: skip the report banner and fragment
         st.info("📈 No questions answered yet. Start practicing to see your performance!")
     else:
-        # Calculate metrics
-        avg = sum(t["eval"]["total"] for t in hist) / len(hist)
-        excellent_count = sum(1 for t in hist if t["eval"]["total"] >= 75)
-        improvement = hist[-1]["eval"]["total"] - hist[0]["eval"]["total"] if len(hist) > 1 else 0
-        
-        # Display metrics in columns
-        m_col1, m_col2, m_col3, m_col4 = st.columns(4)
-        
-        with m_col1:
-            st.metric("Average Score", f"{avg:.1f}/100", delta=f"+{improvement:.1f}" if improvement > 0 else f"{improvement:.1f}")
-        
-        with m_col2:
-            st.metric("Questions Attempted", len(hist))
-        
-        with m_col3:
-            st.metric("Excellent Answers", f"{excellent_count} ⭐")
-        
-        with m_col4:
-            latest_score = hist[-1]["eval"]["total"]
-            score_status = "🌟" if latest_score >= 75 else ("👍" if latest_score >= 50 else "💪")
-            st.metric("Latest Score", f"{latest_score:.1f}/100", label_visibility="collapsed")
-            st.markdown(f"<div style='text-align: center;'>{score_status}</div>", unsafe_allow_html=True)
-        
-        # Show detailed history
-        if st.checkbox("📋 Show Full History", key="show_full_turns", value=False):
-            st.markdown("<div class='feedback-card'>", unsafe_allow_html=True)
-            for idx, t in enumerate(hist, 1):
-                score = t["eval"]["total"]
-                status_emoji = "🌟" if score >= 75 else ("👍" if score >= 50 else "📝")
-                st.markdown(f"""
-                **{idx}. {t['question_id']}** {status_emoji}
-                - Score: {score:.1f}/100
-                - Answer length: {len(t['answer'])} chars
-                """)
-            st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown(_REPORT_HEADER_HTML, unsafe_allow_html=True)
+        render_session_report()
 
     if st.session_state.get("debug_toggle"):
         st.markdown("---")
-        st.subheader("DEBUG: Raw session_state")
-        st.write(st.session_state.to_dict())
+        with st.expander("DEBUG: Raw session_state", expanded=False):
+            # collapsed by default so the (history-sized) tree isn't laid out until asked for
+            st.json(st.session_state.to_dict(), expanded=False)
 
 # ---------------------------
 # Footer
 # ---------------------------
 st.sidebar.markdown("---")
-st.sidebar.markdown("""
-<div style="text-align: center; padding: 1rem; color: #FAFAFA; opacity: 0.8;">
-    <strong>🎯 SkillsBridge</strong><br>
-    <small>AI-Powered Interview Coach</small><br>
-    <small style="font-size: 0.8rem; opacity: 0.7;">Team 12 • CS(AI&DS)</small>
-</div>
-""", unsafe_allow_html=True)
+st.sidebar.markdown(_FOOTER_HTML, unsafe_allow_html=True)